@@ -0,0 +1,38 @@
+import glob
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+
+def expand_paths(
+    paths: Iterable[str],
+    extensions: Set[str],
+    directory_extensions: Optional[Set[str]] = None,
+    exclude: Iterable[str] = (),
+) -> List[str]:
+    """
+    파일, glob 패턴, 디렉터리를 파일 목록으로 펼침
+    디렉터리는 하위의 directory_extensions(기본: extensions) 파일만, exclude(출력 파일 등)는 제외
+    """
+    excluded = {os.path.normcase(os.path.abspath(path)) for path in exclude if path}
+    scan_extensions = directory_extensions or extensions
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                str(p)
+                for p in sorted(Path(path).rglob("*"))
+                if p.suffix.lower() in scan_extensions and p.is_file()
+            )
+        elif glob.has_magic(path):
+            files.extend(
+                p for p in sorted(glob.glob(path, recursive=True)) if os.path.isfile(p)
+            )
+        else:
+            files.append(path)
+    files = [
+        file
+        for file in files
+        if os.path.normcase(os.path.abspath(file)) not in excluded
+    ]
+    return list(dict.fromkeys(files))
@@ -0,0 +1,166 @@
+import argparse
+import multiprocessing
+import sys
+import time
+from typing import List
+
+from aasist.src.cli.common import expand_paths
+from aasist.src.gui.handler import _GUIDANCE_LOG_NAME, QueueHandler
+from aasist.src.module.guidance.batch_table_exporter import (
+    BatchTableExporter,
+    FileExportResult,
+)
+from aasist.src.module.guidance.schema_types import TableFormat
+from aasist.src.module.guidance.submodel_table_extractor import (
+    DEFAULT_EXPORT_OPTIONS,
+    DefaultSubmodel,
+)
+
+_ALL = "all"
+_AASX_EXTENSIONS = {".aasx"}
+
+# GUI 체크박스와 같은 키 (DEFAULT_EXPORT_OPTIONS)
+_SUBMODELS = [submodel.value for submodel in DefaultSubmodel] + ["etc"]
+_COLUMNS = [
+    "model_type",
+    "id_short",
+    "semantic_id",
+    "depth",
+    "definition",
+    "description",
+    "value",
+    "value_type",
+    "reference_type",
+]
+_FORMATS = {"word": TableFormat.DOCX, "excel": TableFormat.XLSX}
+
+
+def _selection(
+    names: List[str], choices: List[str], all_key: str, parser: argparse.ArgumentParser
+) -> List[str]:
+    if _ALL in names:
+        return [all_key] if all_key else list(choices)
+    unknown = [name for name in names if name not in choices]
+    if unknown:
+        parser.error(
+            f"unknown option(s): {', '.join(unknown)} "
+            f"(choose from {_ALL}, {', '.join(choices)})"
+        )
+    return names
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aasist-run guidance --headless",
+        description="Extract guidance tables from AASX files without the GUI.",
+    )
+    parser.add_argument("paths", nargs="+", help="files, glob patterns or directories")
+    parser.add_argument(
+        "--submodels",
+        nargs="+",
+        default=[_ALL],
+        metavar="SUBMODEL",
+        help=f"{_ALL} or any of: {', '.join(_SUBMODELS)} (default: {_ALL})",
+    )
+    parser.add_argument(
+        "--columns",
+        nargs="+",
+        default=[key for key in _COLUMNS if DEFAULT_EXPORT_OPTIONS[key]],
+        metavar="COLUMN",
+        help=f"{_ALL} or any of: {', '.join(_COLUMNS)} (default: GUI defaults)",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=list(_FORMATS),
+        default="word" if DEFAULT_EXPORT_OPTIONS["word"] else "excel",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="DIR",
+        help="output directory, keeping the input layout (default: next to each file)",
+    )
+    parser.add_argument(
+        "--single-file",
+        action="store_true",
+        help="write all submodels of a file into one document",
+    )
+    parser.add_argument(
+        "--simple-model-type",
+        action=argparse.BooleanOptionalAction,
+        default=DEFAULT_EXPORT_OPTIONS["simple_model_type"],
+        help="abbreviate model types (e.g. Property -> Prop)",
+    )
+    parser.add_argument(
+        "--depth-ellipses",
+        action=argparse.BooleanOptionalAction,
+        default=DEFAULT_EXPORT_OPTIONS["depth_ellipses"],
+        help="flatten the hierarchy into the guidance table layout",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="print the full log of each file"
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    submodels = _selection(args.submodels, _SUBMODELS, "all_submodels", parser)
+    columns = _selection(args.columns, _COLUMNS, None, parser)
+
+    files = expand_paths(args.paths, _AASX_EXTENSIONS)
+    if not files:
+        parser.error("no AASX files found")
+
+    log_handler = QueueHandler(_GUIDANCE_LOG_NAME)
+    done = 0
+
+    def on_exported(file: str, result: FileExportResult):
+        nonlocal done
+        done += 1
+        logs = log_handler.drain()
+        if args.verbose:
+            for message, level in logs:
+                print(f"[{level.name}] {message}")
+        status = "OK" if result.passed else "FAIL"
+        print(
+            f"[{done}/{len(files)}] {status} {file} {result.seconds:.2f}s "
+            f"({result.exported} exported, {result.failed} failed)"
+        )
+
+    started = time.perf_counter()
+    exporter = BatchTableExporter(
+        files=files,
+        output_dir=args.output,
+        format=_FORMATS[args.format],
+        submodels=submodels,
+        columns=columns,
+        use_simple_model_type=args.simple_model_type,
+        hide_depth_attributes=args.depth_ellipses,
+        single_file=args.single_file,
+        workers=args.workers,
+        on_exported=on_exported,
+    )
+    results = exporter.export()
+    elapsed = time.perf_counter() - started
+
+    passed = sum(1 for result in results.values() if result.passed)
+    exported = sum(result.exported for result in results.values())
+    print(
+        f"{len(files)} files, {passed} ok, {len(files) - passed} failed, "
+        f"{exported} submodels exported in {elapsed:.2f}s "
+        f"({len(files) / elapsed if elapsed else 0:.2f} files/s)"
+    )
+
+    return 0 if passed == len(files) else 1
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,154 @@
+import argparse
+from enum import Enum
+import multiprocessing
+import sys
+import time
+from typing import Dict, List, Type
+
+from aasist.src.cli.common import expand_paths
+from aasist.src.module.format import AasFileFormat
+from aasist.src.module.tester.constants import IDTA, KOSMO
+from aasist.src.module.tester.file.batch_file_verificator import (
+    BatchFileVerificator,
+)
+from aasist.src.module.tester.report import (
+    FileReport,
+    build_file_report,
+    write_json_report,
+    write_junit_report,
+)
+
+_AAS_EXTENSIONS = {f".{fmt.value}" for fmt in AasFileFormat}
+# 디렉터리 검색은 .aasx만 (json/xml은 보고서 등 AAS가 아닌 파일이 많음), 나머지 형식은 파일/glob으로 지정
+_DIRECTORY_EXTENSIONS = {f".{AasFileFormat.AASX.value}"}
+_ALL = "all"
+
+# 아직 구현되지 않은 옵션 (GUI와 동일하게 제외)
+_UNSUPPORTED_OPTIONS = {IDTA.optional.name}
+
+
+def _options(
+    names: List[str], enum: Type[Enum], parser: argparse.ArgumentParser
+) -> Dict[str, bool]:
+    if not names:
+        return {}
+    if _ALL in names:
+        return {
+            member.name: True
+            for member in enum
+            if member.name not in _UNSUPPORTED_OPTIONS
+        }
+    unknown = [name for name in names if name not in enum.__members__]
+    if unknown:
+        parser.error(
+            f"unknown {enum.__name__} option(s): {', '.join(unknown)} "
+            f"(choose from {_ALL}, {', '.join(enum.__members__)})"
+        )
+    return {name: True for name in names}
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="aasist-run test --headless",
+        description="Validate AAS files without the GUI.",
+    )
+    parser.add_argument("paths", nargs="+", help="files, glob patterns or directories")
+    parser.add_argument(
+        "--idta",
+        nargs="*",
+        default=[IDTA.standard.name],
+        metavar="RULE",
+        help=f"IDTA rules by name or '{_ALL}' (default: {IDTA.standard.name})",
+    )
+    parser.add_argument(
+        "--kosmo",
+        nargs="*",
+        default=[],
+        metavar="RULE",
+        help=f"KOSMO rules by name or '{_ALL}'",
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)"
+    )
+    parser.add_argument("--json", metavar="PATH", help="write a JSON report")
+    parser.add_argument("--junit", metavar="PATH", help="write a JUnit XML report")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="bypass the validation result cache"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="evaluate single-object rules while parsing (findings in parse order)",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="print the full log of each file"
+    )
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    idta_options = _options(args.idta, IDTA, parser)
+    kosmo_options = _options(args.kosmo, KOSMO, parser)
+    if not idta_options and not kosmo_options:
+        parser.error("no rules selected")
+
+    files = expand_paths(
+        args.paths,
+        _AAS_EXTENSIONS,
+        directory_extensions=_DIRECTORY_EXTENSIONS,
+        exclude=(args.json, args.junit),
+    )
+    if not files:
+        parser.error("no AAS files found")
+
+    started = time.perf_counter()
+    batch = BatchFileVerificator(
+        files=files,
+        idta_options=idta_options,
+        kosmo_options=kosmo_options,
+        workers=args.workers,
+        use_cache=not args.no_cache,
+        streaming=args.stream,
+    )
+    batch.verify()
+    elapsed = time.perf_counter() - started
+
+    reports: List[FileReport] = [
+        build_file_report(
+            file,
+            batch.results.get(file, {}),
+            batch.logs.get(file, []),
+            batch.timings.get(file, 0.0),
+        )
+        for file in files
+    ]
+
+    for report in reports:
+        if args.verbose:
+            for message, level in batch.logs.get(report.file, []):
+                print(f"[{level.name}] {message}")
+        failed_rules = [rule.rule for rule in report.rules if not rule.passed]
+        status = "PASS" if report.passed else "FAIL"
+        detail = f" ({', '.join(failed_rules + report.errors[:1])})" if not report.passed else ""
+        print(f"{status} {report.file} {report.seconds:.2f}s{detail}")
+
+    passed = sum(1 for report in reports if report.passed)
+    print(
+        f"{len(reports)} files, {passed} passed, {len(reports) - passed} failed "
+        f"in {elapsed:.2f}s ({len(reports) / elapsed if elapsed else 0:.2f} files/s)"
+    )
+
+    if args.json:
+        write_json_report(reports, args.json, elapsed)
+    if args.junit:
+        write_junit_report(reports, args.junit, elapsed)
+
+    return 0 if passed == len(reports) else 1
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -17,7 +17,9 @@ from aasist.src.gui.handler import _GUIDANCE_LOG_NAME, LogLevel, QueueHandler
 from aasist.src.module.guidance.aasx_file_reader import AasxFileReader
 from aasist.src.module.guidance.json.json_table_parser import JsonTableParser
 from aasist.src.module.guidance.schema_types import TableFormat
-from aasist.src.module.guidance.submodel_table_extractor import DefaultSubmodel
+from aasist.src.module.guidance.submodel_table_extractor import (
+    DEFAULT_EXPORT_OPTIONS,
+)
 from aasist.src.module.guidance.submodel_table_parser import SubmodelTableParser
 
 from aasist.src.module.guidance.xml.xml_table_extractor import XmlTableExtractor
@@ -25,34 +27,7 @@ from aasist.src.module.guidance.xml.xml_table_parser import XmlTableParser
 
 
 class GuidanceScreen(ctk.CTkFrame):
-    default_options = {
-        "word": True,
-        "excel": False,
-        "all_submodels": True,
-        DefaultSubmodel.Identification.value: True,
-        DefaultSubmodel.Documentation.value: True,
-        DefaultSubmodel.HandoverDocumentation.value: True,
-        DefaultSubmodel.CAD.value: True,
-        DefaultSubmodel.CarbonFootprint.value: True,
-        DefaultSubmodel.HierarchicalStructures.value: True,
-        DefaultSubmodel.DigitalNameplate.value: True,
-        DefaultSubmodel.Nameplate.value: True,
-        DefaultSubmodel.TechnicalData.value: True,
-        DefaultSubmodel.OperationalData.value: True,
-        "etc": True,
-        "all_attributes": False,
-        "model_type": True,
-        "id_short": True,
-        "semantic_id": True,
-        "depth": True,
-        "definition": False,
-        "description": True,
-        "value": False,
-        "value_type": False,
-        "reference_type": False,
-        "simple_model_type": True,
-        "depth_ellipses": False,
-    }
+    default_options = DEFAULT_EXPORT_OPTIONS
 
     def __init__(self, parent: ctk.CTkFrame):
         super().__init__(parent)
@@ -336,7 +311,7 @@ class GuidanceScreen(ctk.CTkFrame):
 
         for file, parsers in self._from_readers():
             for parser in parsers:
-                parser.parse_submodels(**kwargs)
+                parser.parse_submodels(streaming=True, **kwargs)
 
                 if isinstance(parser, XmlTableParser):
                     table_extractor = XmlTableExtractor(
@@ -1,3 +1,4 @@
+import multiprocessing
 import customtkinter as ctk
 from aasist.src.gui.util import get_resource_path
 from aasist.src.gui.aasist_test.test_screen import TestScreen
@@ -18,4 +19,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 실행 파일에서 검증 워커 프로세스 지원
     main()
@@ -15,6 +15,9 @@ from aasist.src.gui.common.file_selector import FileSelector
 from aasist.src.gui.common.log_box import LogBox
 from aasist.src.gui.common.tree_checkbox_frame import TreeCheckboxFrame
 from aasist.src.gui.handler import _TEST_LOG_NAME, QueueHandler
+from aasist.src.module.tester.file.batch_file_verificator import (
+    BatchFileVerificator,
+)
 from aasist.src.module.tester.file.file_verificator import TestFileVerficator
 from aasist.src.module.tester.constants import IDTA, KOSMO
 
@@ -326,14 +329,23 @@ class TestScreen(ctk.CTkFrame):
         idta_options[IDTA.all_aasd.name] = self.idta.aasd.is_all.get()
         idta_options[IDTA.all_aasc_3a.name] = self.idta.aasc_3a.is_all.get()
 
-        for file in files:
-            test = TestFileVerficator(
-                file=file,
+        if len(files) > 1:
+            # 파일별 프로세스에서 병렬 검증 (로그는 파일 순서대로 출력)
+            BatchFileVerificator(
+                files=files,
                 stop_event=self.run_button.stop_event,
                 kosmo_options=kosmo_options,
                 idta_options=idta_options,
-            )
-            test.verify()
+            ).verify()
+        else:
+            for file in files:
+                test = TestFileVerficator(
+                    file=file,
+                    stop_event=self.run_button.stop_event,
+                    kosmo_options=kosmo_options,
+                    idta_options=idta_options,
+                )
+                test.verify()
 
         if not api:
             return
@@ -1,10 +1,12 @@
-from queue import Empty
+from typing import Set
 import customtkinter as ctk
-from aasist.src.gui.handler import QueueHandler
+from aasist.src.gui.handler import LogLevel, QueueHandler
 
 
 class LogBox(ctk.CTkFrame):
     MAX_LOG_LINE = 1000
+    MAX_BATCH = 200
+    INTERVAL = 100  # ms
 
     def __init__(
         self,
@@ -16,6 +18,7 @@ class LogBox(ctk.CTkFrame):
         super().__init__(parent, bg_color=bg_color)
         self.log_line = 0
         self.log_queue = log_queue
+        self._level_tags: Set[LogLevel] = set()
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
@@ -27,36 +30,30 @@ class LogBox(ctk.CTkFrame):
         )
         self.output_box.grid(row=0, column=0, sticky=ctk.NSEW)
 
-        self.after(100, self._monitoring_logs)
+        self.after(self.INTERVAL, self._monitoring_logs)
 
     def _monitoring_logs(self):
-        while True:
-            try:
-                if self.log_line > self.MAX_LOG_LINE:
-                    self._remove_old_logs()
-                log_message, log_level = self.log_queue.get()
-                if not self.output_box:
-                    return
-                self.output_box.configure(state=ctk.NORMAL)
-                start_index = self.output_box.index(f"{ctk.END}-1c")
-                self.output_box.insert(ctk.END, log_message + "\n")
-                last_index = self.output_box.index(f"{ctk.END}-1c")
-                tag_name = f"{self.log_line}{log_level.name}"
-                self.output_box.tag_add(tag_name, start_index, last_index)
-                self.output_box.tag_config(tag_name, foreground=log_level.color)
-                self.output_box.see(ctk.END)
-                self.output_box.configure(state=ctk.DISABLED)
-                self.log_line += 1
-            except Empty:
-                break
+        # 로그 생산 속도와 무관하게 주기마다 최대 MAX_BATCH 줄씩 한 번에 그림
+        logs = self.log_queue.drain(self.MAX_BATCH)
+        if logs and self.output_box:
+            if self.log_line + len(logs) > self.MAX_LOG_LINE:
+                self._remove_old_logs()
+            self.output_box.configure(state=ctk.NORMAL)
+            for log_message, log_level in logs:
+                if log_level not in self._level_tags:
+                    self.output_box.tag_config(log_level.name, foreground=log_level.color)
+                    self._level_tags.add(log_level)
+                self.output_box.insert(ctk.END, log_message + "\n", log_level.name)
+            self.output_box.see(ctk.END)
+            self.output_box.configure(state=ctk.DISABLED)
+            self.log_line += len(logs)
 
-        self.after(100, self._monitoring_logs)
+        self.after(self.INTERVAL, self._monitoring_logs)
 
     def _remove_old_logs(self):
         old_lines = self.MAX_LOG_LINE // 4
         self.output_box.configure(state=ctk.NORMAL)
-        for _ in range(old_lines):
-            self.output_box.delete("1.0", "2.0")
+        self.output_box.delete("1.0", f"{old_lines + 1}.0")
         self.output_box.configure(state=ctk.DISABLED)
 
         self.log_line -= old_lines
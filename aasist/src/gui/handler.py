@@ -1,8 +1,10 @@
 import asyncio
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
-from queue import Queue
+from queue import Empty, Queue
 import threading
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 class LogLevel(Enum):
@@ -21,6 +23,11 @@ _GUIDANCE_LOG_NAME = "GUIDANCE_OUTPUT"
 _RESULT_LOG_NAME = "TEST_RESULT_OUTPUT"
 _TEST_LOG_NAME = "TEST_OUTPUT"
 
+# 현재 문맥(스레드, asyncio 작업)에서 핸들러 키별로 바꿔 쓰는 큐
+_redirected_queues: ContextVar[Dict[str, Queue]] = ContextVar(
+    "_redirected_queues", default={}
+)
+
 
 class QueueHandler:
 
@@ -44,11 +51,41 @@ class QueueHandler:
     def _init_instance(self, log_queue: Queue):
         self.log_queue = log_queue
 
+    @property
+    def current_queue(self) -> Queue:
+        return _redirected_queues.get().get(self.key, self.log_queue)
+
+    @contextmanager
+    def redirect(self, log_queue: Queue) -> Iterator[Queue]:
+        """
+        현재 문맥에서만 로그를 log_queue로 보냄 (다른 스레드/작업의 로그와 섞이지 않음)
+        """
+        token = _redirected_queues.set(
+            {**_redirected_queues.get(), self.key: log_queue}
+        )
+        try:
+            yield log_queue
+        finally:
+            _redirected_queues.reset(token)
+
     def add(self, log: str, log_level: LogLevel = LogLevel.TRACE):
-        self.log_queue.put((log, log_level))
+        self.current_queue.put((log, log_level))
 
     def get(self) -> Tuple[str, LogLevel]:
-        return self.log_queue.get(block=False)
+        return self.current_queue.get(block=False)
+
+    def drain(self, max_count: Optional[int] = None) -> List[Tuple[str, LogLevel]]:
+        """
+        쌓여 있는 로그를 한 번에 꺼냄 (max_count: 한 번에 꺼낼 최대 개수)
+        """
+        log_queue = self.current_queue
+        logs: List[Tuple[str, LogLevel]] = []
+        while max_count is None or len(logs) < max_count:
+            try:
+                logs.append(log_queue.get_nowait())
+            except Empty:
+                break
+        return logs
 
     @classmethod
     def get_handler(cls, key: str) -> Optional["QueueHandler"]:
@@ -56,8 +93,9 @@ class QueueHandler:
             return cls._instances[key]
 
     def clear(self):
-        while not self.log_queue.empty():
+        log_queue = self.current_queue
+        while not log_queue.empty():
             try:
-                self.log_queue.get_nowait()
+                log_queue.get_nowait()
             except:
                 break
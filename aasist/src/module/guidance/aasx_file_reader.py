@@ -1,7 +1,8 @@
-from io import BytesIO
 import logging
 import os
 import re
+import shutil
+import tempfile
 from typing import IO, Iterable, Optional, Union
 import pyecma376_2
 from aasist.src.module.format import AasFileFormat
@@ -17,6 +18,7 @@ class AasxFileReader:
     AAS_SPEC_KEY = "http://admin-shell.io/aasx/relationships/aas-spec"
     AAS_SPEC_SPLIT_KEY = "http://admin-shell.io/aasx/relationships/aas-spec-split"
     AAS_SUPL_KEY = "http://admin-shell.io/aasx/relationships/aas-suppl"
+    SPOOL_MAX_SIZE = 16 * 1024 * 1024
 
     def __init__(self, file: Union[os.PathLike, str, IO]):
         self._file = file
@@ -72,9 +74,11 @@ class AasxFileReader:
     ) -> Optional[SubmodelTableParser]:
         try:
             with self.zip_reader.open_part(part_name) as part:
-                memory = BytesIO(part.read())
-                memory.seek(0)
-                xml_parser = XmlTableParser(file=memory)
+                # 큰 파트는 메모리 대신 임시 파일로 넘김 (streaming parse)
+                spool = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE)
+                shutil.copyfileobj(part, spool)
+                spool.seek(0)
+                xml_parser = XmlTableParser(file=spool)
                 return xml_parser
         except Exception as e:
             logger.error(f"failed to read xml format: {part_name} | {e}")
@@ -0,0 +1,162 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+import multiprocessing
+import os
+from queue import Queue
+import time
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from aasist.src.gui.handler import _GUIDANCE_LOG_NAME, LogLevel, QueueHandler
+from aasist.src.module.guidance.aasx_file_reader import AasxFileReader
+from aasist.src.module.guidance.schema_types import TableFormat
+from aasist.src.module.guidance.xml.xml_table_extractor import XmlTableExtractor
+from aasist.src.module.guidance.xml.xml_table_parser import XmlTableParser
+
+_PENDING_PER_WORKER = 2
+
+
+@dataclass
+class FileExportResult:
+    exported: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+    logs: List[Tuple[str, LogLevel]] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        return self.failed == 0 and not any(
+            level == LogLevel.ERROR for _, level in self.logs
+        )
+
+
+def _export_file(
+    file: str,
+    file_name: str,
+    format: TableFormat,
+    submodels: List[str],
+    columns: List[str],
+    use_simple_model_type: bool,
+    hide_depth_attributes: bool,
+    single_file: bool,
+) -> FileExportResult:
+    """
+    AasxFileReader -> XmlTableParser -> XmlTableExtractor (프로세스 풀 워커에서 파일 단위로 실행)
+    file_name: 출력 경로의 기준이 되는 파일 이름 (확장자는 출력 형식으로 대체)
+    """
+    started = time.perf_counter()
+    # 워커는 여러 파일을 처리하므로 파일마다 로그 큐를 새로 연결
+    log_handler = QueueHandler(_GUIDANCE_LOG_NAME)
+    log_handler._init_instance(Queue())
+    result = FileExportResult()
+
+    try:
+        os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+        parsers = [
+            parser
+            for parser in AasxFileReader(file).load_submodel_table_parsers()
+            if isinstance(parser, XmlTableParser)
+        ]
+        if not parsers:
+            log_handler.add(
+                f"No parser found for file: {file}", log_level=LogLevel.ERROR
+            )
+        for parser in parsers:
+            parser.parse_submodels(streaming=True)
+            table_extractor = XmlTableExtractor(
+                file_name=file_name,
+                parser=parser,
+                columns=columns,
+                submodels=submodels,
+                use_simple_model_type=use_simple_model_type,
+                hide_depth_attributes=hide_depth_attributes,
+            )
+            table_extractor.extract_table()
+            table_extractor.export(format=format, single_file=single_file)
+            result.exported += table_extractor.success_count
+            result.failed += table_extractor.failure_count
+    except Exception as e:
+        log_handler.add(f"Error loading file: {file} {e}", log_level=LogLevel.ERROR)
+
+    result.logs = log_handler.drain()
+    result.seconds = time.perf_counter() - started
+    return result
+
+
+class BatchTableExporter:
+    """
+    여러 AASX 파일의 가이던스 표를 프로세스 풀에서 추출
+    결과와 로그는 파일 순서대로 수집해 _GUIDANCE_LOG_NAME 핸들러에 전달
+    output_dir: 입력 파일들의 공통 상위 디렉터리 기준 상대 경로를 그대로 유지 (없으면 입력 파일 옆에 기록)
+    """
+
+    def __init__(self, files: List[str], **kwargs):
+        self._files = files
+        self.output_dir: Optional[str] = kwargs.get("output_dir", None)
+        self.format: TableFormat = kwargs.get("format", TableFormat.DOCX)
+        self.submodels: List[str] = kwargs.get("submodels", [])
+        self.columns: List[str] = kwargs.get("columns", [])
+        self.use_simple_model_type: bool = kwargs.get("use_simple_model_type", False)
+        self.hide_depth_attributes: bool = kwargs.get("hide_depth_attributes", False)
+        self.single_file: bool = kwargs.get("single_file", False)
+        self.workers: int = kwargs.get("workers") or os.cpu_count() or 1
+        self.on_exported: Callable[[str, FileExportResult], None] = kwargs.get(
+            "on_exported", None
+        )
+        self.results: Dict[str, FileExportResult] = {}
+        self.log_handler = QueueHandler(_GUIDANCE_LOG_NAME)
+
+    def export(self) -> Dict[str, FileExportResult]:
+        if not self._files:
+            return self.results
+
+        workers = min(self.workers, len(self._files))
+        root = os.path.commonpath(
+            [os.path.dirname(os.path.abspath(file)) for file in self._files]
+        )
+        pending: Deque[Tuple[str, Future]] = deque()
+        # spawn: GUI(Tk) 스레드가 있는 프로세스를 fork 하지 않음
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            for file in self._files:
+                future = pool.submit(
+                    _export_file,
+                    file,
+                    self._output_name(file, root),
+                    self.format,
+                    self.submodels,
+                    self.columns,
+                    self.use_simple_model_type,
+                    self.hide_depth_attributes,
+                    self.single_file,
+                )
+                pending.append((file, future))
+
+                # 대기열이 차면 가장 먼저 넣은 파일부터 결과 수집
+                while len(pending) >= workers * _PENDING_PER_WORKER:
+                    self._collect(*pending.popleft())
+
+            while pending:
+                self._collect(*pending.popleft())
+
+        return self.results
+
+    def _collect(self, file: str, future: Future):
+        try:
+            result: FileExportResult = future.result()
+        except Exception as e:
+            result = FileExportResult(
+                logs=[(f"Error exporting file: {file} {e}", LogLevel.ERROR)]
+            )
+        self.results[file] = result
+        for log in result.logs:
+            self.log_handler.add(*log)
+        if self.on_exported:
+            self.on_exported(file, result)
+
+    def _output_name(self, file: str, root: str) -> str:
+        if not self.output_dir:
+            return file
+        return os.path.join(
+            self.output_dir, os.path.relpath(os.path.abspath(file), root)
+        )
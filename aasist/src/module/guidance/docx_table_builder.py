@@ -0,0 +1,98 @@
+import re
+from typing import Any, List
+from xml.sax.saxutils import escape
+
+from docx.document import Document as DocumentObject
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu
+from docx.table import Table
+
+from aasist.src.module.guidance.submodel_table_model import SubmodelTable
+
+
+_SPECIAL_CHARS = re.compile(r"([\t\r\n])")
+
+
+class DocxTableBuilder:
+    """
+    Builds the "Table Grid" table of a SubmodelTable as one w:tbl fragment.
+    Produces the same XML as the python-docx cell API (header cells centered and
+    merged with gridSpan, every cell vertically centered) without a proxy object per cell.
+    """
+
+    STYLE = "Table Grid"
+
+    def __init__(self, document: DocumentObject):
+        self._document = document
+
+    def build(self, table: SubmodelTable) -> Table:
+        column_count = len(table.headers)
+        section = self._document.sections[-1]
+        block_width = section.page_width - section.left_margin - section.right_margin
+        column_width = Emu(block_width // column_count).twips if column_count else 0
+
+        # 행 조각을 모두 만든 뒤에 문서에 추가 (중간에 실패하면 문서는 그대로)
+        xml: List[str] = [f"<w:tbl {nsdecls('w')}>", self._header_xml(table, column_width)]
+        for row in table.rows():
+            xml.append("<w:tr>")
+            for value in row:
+                xml.append(self._cell_xml(value, column_width))
+            xml.append("</w:tr>")
+        xml.append("</w:tbl>")
+        rows = list(parse_xml("".join(xml)))
+
+        docx_table = self._document.add_table(rows=0, cols=column_count)
+        docx_table.style = self.STYLE
+        docx_table._tbl.extend(rows)
+        return docx_table
+
+    def _header_xml(self, table: SubmodelTable, column_width: int) -> str:
+        merges = {start: (end, label) for start, end, label in table.header_merges}
+        cells: List[str] = []
+        i = 0
+        while i < len(table.headers):
+            end, label = merges.get(i, (i, table.headers[i]))
+            cells.append(
+                self._cell_xml(
+                    label,
+                    column_width * (end - i + 1),
+                    span=end - i + 1,
+                    centered=True,
+                )
+            )
+            i = end + 1
+        return "<w:tr>" + "".join(cells) + "</w:tr>"
+
+    def _cell_xml(
+        self,
+        value: Any,
+        width: int,
+        span: int = 1,
+        centered: bool = False,
+    ) -> str:
+        text = "" if value is None or not isinstance(value, str) else value
+        return (
+            "<w:tc><w:tcPr>"
+            f'<w:tcW w:type="dxa" w:w="{width}"/>'
+            + (f'<w:gridSpan w:val="{span}"/>' if span > 1 else "")
+            + '<w:vAlign w:val="center"/></w:tcPr><w:p>'
+            + ('<w:pPr><w:jc w:val="center"/></w:pPr>' if centered else "")
+            + f"<w:r>{self._run_content_xml(text)}</w:r></w:p></w:tc>"
+        )
+
+    def _run_content_xml(self, text: str) -> str:
+        # python-docx와 동일: 탭 -> w:tab, 줄바꿈 -> w:br
+        content: List[str] = []
+        for part in _SPECIAL_CHARS.split(text):
+            if not part:
+                continue
+            if part == "\t":
+                content.append("<w:tab/>")
+            elif part in ("\r", "\n"):
+                content.append("<w:br/>")
+            elif len(part.strip()) < len(part):
+                content.append(f'<w:t xml:space="preserve">{escape(part)}</w:t>')
+            else:
+                content.append(f"<w:t>{escape(part)}</w:t>")
+        return "".join(content)
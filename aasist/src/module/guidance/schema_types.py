@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Dict
 
 
 class TableFormat(Enum):
@@ -17,11 +18,17 @@ class ParentElement(Enum):
 
     @classmethod
     def contains(cls, value: str) -> bool:
-        value = value.lower()
-        return any(
-            value == full.lower() or value.lower() == short.lower()
-            for full, short in (e.value for e in cls)
-        )
+        found = _PARENT_ELEMENT_LOOKUP.get(value)
+        if found is None:
+            found = _PARENT_ELEMENT_LOOKUP[value] = value.lower() in _PARENT_ELEMENT_NAMES
+        return found
+
+
+_PARENT_ELEMENT_NAMES = frozenset(
+    name.lower() for element in ParentElement for name in element.value
+)
+# model type 문자열 -> 결과 캐시 (model type 종류는 많지 않음)
+_PARENT_ELEMENT_LOOKUP: Dict[str, bool] = {}
 
 
 # Extracted from: package-explorer/src/AasxCsharpLibrary/AasxCompatibilityModels/V20/AdminShell.cs
@@ -64,3 +71,9 @@ SIMPLE_MODEL_TYPES = {
     "BasicEvent": "Evt",
     "SubmodelElementList": "SML",
 }
+
+_SIMPLE_MODEL_TYPE_LOOKUP = {k.lower(): v for k, v in SIMPLE_MODEL_TYPES.items()}
+
+
+def simple_model_type(model_type: str) -> str:
+    return _SIMPLE_MODEL_TYPE_LOOKUP.get(model_type.lower(), model_type)
@@ -1,24 +1,41 @@
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from enum import Enum, auto
-import os
+import multiprocessing
 import re
 from typing import (
+    TYPE_CHECKING,
+    Deque,
     Dict,
     Iterable,
     List,
+    Set,
     Tuple,
 )
 from docx import Document
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_ALIGN_VERTICAL
-import pandas as pd
+from docx.document import Document as DocumentObject
 from aasist.src.gui.handler import _GUIDANCE_LOG_NAME, LogLevel, QueueHandler
+from aasist.src.module.guidance.docx_table_builder import DocxTableBuilder
 from aasist.src.module.guidance.schema_types import TableFormat
+from aasist.src.module.guidance.submodel_table_model import SubmodelTable
 from aasist.src.module.guidance.submodel_table_parser import (
     ParseObject,
     SubmodelTableParser,
 )
-from openpyxl import load_workbook
+
+# openpyxl(numpy 포함)은 XLSX를 만들 때만 import (GUI/CLI 시작 시간 단축)
+if TYPE_CHECKING:
+    import pandas as pd
+    from openpyxl import Workbook
+    from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+# 병렬 export 시 워커당 대기시킬 수 있는 서브모델 수 (테이블을 무한정 쌓아두지 않음)
+_PENDING_PER_WORKER = 2
+
+# Excel 시트 이름 제약: 31자, []:*?/\ 사용 불가
+_XLSX_SHEET_TITLE_MAX = 31
+_XLSX_SHEET_TITLE_INVALID = re.compile(r"[\[\]:*?/\\]")
 
 
 class RowPipelineStage(Enum):
@@ -59,6 +76,37 @@ class DefaultSubmodel(Enum):
         return (submodel.value, submodel.name)
 
 
+# 가이던스 추출 기본 옵션 (GUI 기본값, headless CLI 기본값)
+DEFAULT_EXPORT_OPTIONS: Dict[str, bool] = {
+    "word": True,
+    "excel": False,
+    "all_submodels": True,
+    DefaultSubmodel.Identification.value: True,
+    DefaultSubmodel.Documentation.value: True,
+    DefaultSubmodel.HandoverDocumentation.value: True,
+    DefaultSubmodel.CAD.value: True,
+    DefaultSubmodel.CarbonFootprint.value: True,
+    DefaultSubmodel.HierarchicalStructures.value: True,
+    DefaultSubmodel.DigitalNameplate.value: True,
+    DefaultSubmodel.Nameplate.value: True,
+    DefaultSubmodel.TechnicalData.value: True,
+    DefaultSubmodel.OperationalData.value: True,
+    "etc": True,
+    "all_attributes": False,
+    "model_type": True,
+    "id_short": True,
+    "semantic_id": True,
+    "depth": True,
+    "definition": False,
+    "description": True,
+    "value": False,
+    "value_type": False,
+    "reference_type": False,
+    "simple_model_type": True,
+    "depth_ellipses": False,
+}
+
+
 class SubmodelTableExtractor(ABC):
 
     def __init__(
@@ -77,83 +125,237 @@ class SubmodelTableExtractor(ABC):
         self.failure_count = 0
 
     def export(self, format: TableFormat, **kwargs):
+        """
+        workers > 1: 서브모델을 프로세스 풀로 나눠 기록 (로그는 서브모델 순서대로)
+        single_file: 모든 서브모델을 하나의 파일에 기록 (xlsx: 서브모델별 시트, docx: 제목 + 표)
+        """
         self._prefix = re.sub(r"\.[^.]*$", "", (self._file_name or "output"))
 
         log_handler: QueueHandler = kwargs.get(
             "log_handler", QueueHandler(_GUIDANCE_LOG_NAME)
         )
-        try:
-            for submodel, df in self._to_dataframes():
-                if format == TableFormat.DOCX:
-                    docx = Document()
-                    table = docx.add_table(rows=1, cols=len(df.columns))
-                    table.style = "Table Grid"
-
-                    for i, column in enumerate(df.columns):
-                        cell = table.cell(0, i)
-                        cell.text = column
-                        cell.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-                        if i > 0:
-                            left = table.cell(0, i - 1)
-                            if not left.text:
-                                left.merge(cell)
-                                left.text = left.text.strip()
-                                left.paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                                left.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-
-                    for row in df.itertuples(index=False):
-                        cells = table.add_row().cells
-                        for i, value in enumerate(row):
-                            cells[i].vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-                            cells[i].paragraphs[0].alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            cells[i].text = (
-                                ""
-                                if value is None or not isinstance(value, str)
-                                else str(value)
-                            )
-                    log_handler.add(
-                        f"Exporting submodel '{submodel}' to {self._prefix}_{submodel}.docx"
+        workers: int = kwargs.get("workers") or 1
+
+        if kwargs.get("single_file"):
+            self._export_single_file(format, log_handler)
+            return
+
+        if workers > 1 and len(self._submodel_store) > 1:
+            self._export_parallel(format, log_handler, workers)
+            return
+
+        for submodel, rows in self._submodel_store.items():
+            self._log_exporting(format, submodel, log_handler)
+            try:
+                write_submodel_table(
+                    format, self._export_path(submodel), self._to_table(submodel, rows)
+                )
+                self.success_count += 1
+            except Exception as e:
+                self._log_failure(e, log_handler)
+
+    def _export_parallel(
+        self, format: TableFormat, log_handler: QueueHandler, workers: int
+    ):
+        pending: Deque[Tuple[str, Future]] = deque()
+        # spawn: GUI(Tk) 스레드가 있는 프로세스를 fork 하지 않음
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            for submodel, rows in self._submodel_store.items():
+                try:
+                    future = pool.submit(
+                        write_submodel_table,
+                        format,
+                        self._export_path(submodel),
+                        self._to_table(submodel, rows),
                     )
-                    docx.save(self._prefix + "_" + submodel + ".docx")
+                except Exception as e:
+                    future = Future()
+                    future.set_exception(e)
+                pending.append((submodel, future))
 
+                # 대기열이 차면 가장 먼저 넣은 서브모델부터 결과 수집
+                while len(pending) >= workers * _PENDING_PER_WORKER:
+                    self._collect(format, *pending.popleft(), log_handler)
+
+            while pending:
+                self._collect(format, *pending.popleft(), log_handler)
+
+    def _export_single_file(self, format: TableFormat, log_handler: QueueHandler):
+        if format == TableFormat.DOCX:
+            document, path = Document(), self._prefix + ".docx"
+        if format == TableFormat.XLSX:
+            from openpyxl import Workbook
+
+            document, path = Workbook(write_only=True), self._prefix + ".xlsx"
+        sheet_titles: Set[str] = set()
+
+        written = 0
+        for submodel, rows in self._submodel_store.items():
+            if format == TableFormat.DOCX:
+                log_handler.add(f"Exporting submodel '{submodel}' to {path}")
+            if format == TableFormat.XLSX:
+                log_handler.add(f"Exporting Submodel '{submodel}' to {path}")
+            title = None
+            try:
+                table = self._to_table(submodel, rows)
+                if format == TableFormat.DOCX:
+                    _add_docx_table(document, table, heading=submodel)
                 if format == TableFormat.XLSX:
-                    temp_file_name = self._prefix + "_" + submodel + "_temp.xlsx"
-                    df.to_excel(temp_file_name, index=False)
-                    wb = load_workbook(temp_file_name)
-                    ws = wb.active
-
-                    for i, cell in enumerate(ws[1], start=1):
-                        if not cell.value and i < len(ws[1]) - 1:
-                            right = ws.cell(row=1, column=i + 1)
-                            if right.value:
-                                cell.value = right.value
-                                ws.merge_cells(
-                                    start_row=1,
-                                    start_column=i,
-                                    end_row=1,
-                                    end_column=i + 1,
-                                )
-
-                    log_handler.add(
-                        f"Exporting Submodel '{submodel}' to {self._prefix}_{submodel}.xlsx"
-                    )
-                    wb.save(self._prefix + "_" + submodel + ".xlsx")
-                    wb.close()
-                    os.remove(temp_file_name)
+                    title = _sheet_title(submodel, sheet_titles)
+                    _add_xlsx_sheet(document, table, title)
+                written += 1
+            except Exception as e:
+                if title is not None:
+                    sheet_titles.discard(title.lower())
+                self._log_failure(e, log_handler)
 
-                self.success_count += 1
+        if not written:
+            return
+        try:
+            document.save(path)
+            self.success_count += written
         except Exception as e:
-            self.failure_count += 1
+            # 파일 하나에 모아 쓰므로 저장 실패 시 담긴 서브모델 전부 실패
+            self.failure_count += written
             log_handler.add(
                 f"Error exporting Submodel : {e}",
                 log_level=LogLevel.ERROR,
             )
 
+    def _collect(
+        self,
+        format: TableFormat,
+        submodel: str,
+        future: Future,
+        log_handler: QueueHandler,
+    ):
+        self._log_exporting(format, submodel, log_handler)
+        try:
+            future.result()
+            self.success_count += 1
+        except Exception as e:
+            self._log_failure(e, log_handler)
+
+    def _log_exporting(
+        self, format: TableFormat, submodel: str, log_handler: QueueHandler
+    ):
+        path = self._export_path(submodel)
+        if format == TableFormat.DOCX:
+            log_handler.add(f"Exporting submodel '{submodel}' to {path}.docx")
+        if format == TableFormat.XLSX:
+            log_handler.add(f"Exporting Submodel '{submodel}' to {path}.xlsx")
+
+    def _log_failure(self, e: Exception, log_handler: QueueHandler):
+        self.failure_count += 1
+        log_handler.add(
+            f"Error exporting Submodel : {e}",
+            log_level=LogLevel.ERROR,
+        )
+
+    def _export_path(self, submodel: str) -> str:
+        return self._prefix + "_" + submodel
+
     @abstractmethod
     def extract_table(self):
         pass
 
     @abstractmethod
-    def _to_dataframes(self) -> Iterable[Tuple[str, pd.DataFrame]]:
+    def _to_table(self, submodel: str, rows: ParseObject) -> SubmodelTable:
         pass
+
+    def _to_tables(self) -> Iterable[Tuple[str, SubmodelTable]]:
+        for submodel, rows in self._submodel_store.items():
+            yield (submodel, self._to_table(submodel, rows))
+
+    def _to_dataframes(self) -> Iterable[Tuple[str, "pd.DataFrame"]]:
+        for submodel, table in self._to_tables():
+            yield (submodel, table.to_dataframe())
+
+
+def write_submodel_table(format: TableFormat, path: str, table: SubmodelTable):
+    """
+    path: 확장자를 제외한 출력 경로 (프로세스 풀 워커에서도 호출되므로 모듈 함수)
+    """
+    if format == TableFormat.DOCX:
+        _write_docx(path, table)
+    if format == TableFormat.XLSX:
+        _write_xlsx(path, table)
+
+
+def _write_docx(path: str, table: SubmodelTable):
+    docx = Document()
+    _add_docx_table(docx, table)
+    docx.save(path + ".docx")
+
+
+def _add_docx_table(docx: DocumentObject, table: SubmodelTable, heading: str = None):
+    docx_table = DocxTableBuilder(docx).build(table)
+    if heading is not None:
+        # 표가 완성된 뒤에 제목을 표 앞으로 옮김 (표 생성이 실패하면 제목도 남지 않음)
+        docx_table._tbl.addprevious(docx.add_heading(heading, level=1)._p)
+
+
+def _write_xlsx(path: str, table: SubmodelTable):
+    # write_only: 행을 바로 스트림으로 기록 (시트 전체를 메모리에 두지 않음)
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    _add_xlsx_sheet(wb, table, "Sheet1")
+    wb.save(path + ".xlsx")
+
+
+def _add_xlsx_sheet(wb: "Workbook", table: SubmodelTable, title: str):
+    ws = wb.create_sheet(title)
+    try:
+        _write_xlsx_rows(ws, table)
+    except Exception:
+        # write_only 시트는 행을 바로 기록하므로 실패한 시트를 닫고 통째로 제거
+        ws.close()
+        wb.remove(ws)
+        raise
+
+
+def _write_xlsx_rows(ws: "WriteOnlyWorksheet", table: SubmodelTable):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Border, Font, Side
+    from openpyxl.worksheet.cell_range import CellRange
+
+    headers: List[str] = list(table.headers)
+    for start, end, label in table.header_merges:
+        headers[start] = label
+        for i in range(start + 1, end + 1):
+            headers[i] = None
+        # write_only 시트는 merge_cells가 없어서 범위만 등록 (저장 시 mergeCells로 기록)
+        ws.merged_cells.add(
+            CellRange(min_col=start + 1, min_row=1, max_col=end + 1, max_row=1)
+        )
+
+    # pandas to_excel 헤더 스타일과 동일
+    font = Font(bold=True)
+    side = Side(style="thin")
+    border = Border(left=side, right=side, top=side, bottom=side)
+    alignment = Alignment(horizontal="center", vertical="top")
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(ws, value=header or None)
+        cell.font = font
+        cell.border = border
+        cell.alignment = alignment
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    for row in table.rows():
+        ws.append(row)
+
+
+def _sheet_title(submodel: str, used: Set[str]) -> str:
+    base = _XLSX_SHEET_TITLE_INVALID.sub("_", submodel)[:_XLSX_SHEET_TITLE_MAX] or "Sheet"
+    title, n = base, 1
+    # Excel 시트 이름은 대소문자 구분 없이 유일해야 함
+    while title.lower() in used:
+        n += 1
+        suffix = f"~{n}"
+        title = base[: _XLSX_SHEET_TITLE_MAX - len(suffix)] + suffix
+    used.add(title.lower())
+    return title
@@ -1,5 +1,8 @@
 from dataclasses import asdict, dataclass, field
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 @dataclass
@@ -101,3 +104,48 @@ class ConceptDescriptionModel:
 
     def to_dict(self) -> dict:
         return {(k.lstrip("_")): v for k, v in asdict(self).items()}
+
+
+@dataclass
+class SubmodelTable:
+    """
+    Column-major guidance table of one submodel, consumed directly by the writers.
+    """
+
+    name: str
+    headers: List[str] = field(default_factory=list)
+    columns: List[List[Any]] = field(default_factory=list)
+
+    @property
+    def row_count(self) -> int:
+        return len(self.columns[0]) if self.columns else 0
+
+    @property
+    def header_merges(self) -> List[Tuple[int, int, str]]:
+        """
+        (first column, last column, label) of merged header cells:
+        an empty header cell is merged with the cell on its right
+        """
+        merges: List[Tuple[int, int, str]] = []
+        if not self.headers:
+            return merges
+
+        start, end, label = 0, 0, self.headers[0]
+        for i in range(1, len(self.headers)):
+            if not label:
+                end, label = i, self.headers[i].strip()
+                continue
+            if end > start:
+                merges.append((start, end, label))
+            start, end, label = i, i, self.headers[i]
+        if end > start:
+            merges.append((start, end, label))
+        return merges
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        return zip(*self.columns)
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+
+        return pd.DataFrame(list(self.rows()), columns=self.headers)
@@ -16,10 +16,10 @@ from annotated_types import T
 _P = TypeVar("_P", bound="ParseObject")
 
 
-@dataclass(init=False)
+@dataclass(slots=True)
 class ParseObjectIdentifier:
-    id: str
-    id_short: str
+    id: Optional[str] = None
+    id_short: Optional[str] = None
 
 
 @dataclass(kw_only=True, slots=True)
@@ -1,4 +1,5 @@
 import copy
+from typing import Optional
 from aasist.src.module.guidance.submodel_table_extractor import (
     ConceptDescriptionPipelineStage,
     RowPipelineStage,
@@ -24,6 +25,7 @@ class XmlRowBuilder(ModelBuilder):
         )
         self.committed_instance: RowModel = self.committed_instance
         self.current_instance: RowModel = self.current_instance
+        self._model_tag: Optional[XmlTags] = None  # current_instance.model_type
 
     def handle(self, object: XmlDataObject, **kwargs):
         """
@@ -66,7 +68,7 @@ class XmlRowBuilder(ModelBuilder):
 
     def is_committed(self, object: XmlDataObject) -> bool:
         if not self.committed_instance.is_empty:
-            if XmlTags.is_match(object.tag, XmlTags.ID_SHORT):
+            if object.xml_tag is XmlTags.ID_SHORT:
                 return True
         return False
 
@@ -74,8 +76,10 @@ class XmlRowBuilder(ModelBuilder):
         continue_: bool = True
         break_: bool = False
 
+        xml_tag = object.xml_tag
+
         # flow idShort
-        if XmlTags.is_match(object.tag, XmlTags.ID_SHORT):
+        if xml_tag is XmlTags.ID_SHORT:
             if not self.current_instance.is_empty:
                 self._stage = RowPipelineStage.flush
                 return continue_
@@ -86,30 +90,26 @@ class XmlRowBuilder(ModelBuilder):
             return break_
 
         # flow submodel id
-        if XmlTags.is_match(object.parent.tag, XmlTags.SUBMODEL) and XmlTags.is_match(
-            object.tag, XmlTags.ID
-        ):
+        if object.parent_xml_tag is XmlTags.SUBMODEL and xml_tag is XmlTags.ID:
             self._stage = RowPipelineStage.set_submodel_id
             return continue_
 
         # flow description or MLP value
         if (
-            XmlTags.is_match(object.tag, XmlTags.LANG_STRING_TEXT_TYPE)
+            xml_tag is XmlTags.LANG_STRING_TEXT_TYPE
             and self.current_instance.model_type
         ):
 
-            if XmlTags.is_match(
-                self.current_instance.model_type, XmlTags.MULTI_LANGUAGE_PROPERTY
-            ):
+            if self._model_tag is XmlTags.MULTI_LANGUAGE_PROPERTY:
                 self._stage = RowPipelineStage.set_MLP_model_value
                 return break_
-            if object.children:
+            if object.has_children:
                 self._stage = RowPipelineStage.set_description
             return break_
 
         # flow semanticID or value
-        if object.parent.tag == _AAS_KEY + self.current_instance.model_type:
-            if XmlTags.is_match(object.tag, XmlTags.SEMANTIC_ID):
+        if self._model_tag is not None and object.parent_xml_tag is self._model_tag:
+            if xml_tag is XmlTags.SEMANTIC_ID:
                 self._stage = RowPipelineStage.set_semantic_id
                 return break_
             self._stage = RowPipelineStage.set_model_value
@@ -118,30 +118,28 @@ class XmlRowBuilder(ModelBuilder):
         return break_
 
     def _handle_set_semantic_id(self, object: XmlDataObject):
-        if XmlTags.is_match(object.tag, XmlTags.TYPE) and XmlTags.is_match(
-            object.parent.tag, XmlTags.KEY
-        ):
+        xml_tag = object.xml_tag
+        if xml_tag is XmlTags.TYPE and object.parent_xml_tag is XmlTags.KEY:
             self.current_instance.reference_type = object.text
-        if XmlTags.is_match(object.tag, XmlTags.VALUE):
+        if xml_tag is XmlTags.VALUE:
             self.current_instance.semantic_id = object.text
             self._stage = RowPipelineStage.idle
 
     def _handle_set_description(self, object: XmlDataObject):
-        if XmlTags.is_match(object.tag, XmlTags.TEXT):
+        if object.xml_tag is XmlTags.TEXT:
             self.current_instance.description = object.text
             self._stage = RowPipelineStage.idle
 
     def _handle_set_MLP_model_value(self, object: XmlDataObject):
-        if XmlTags.is_match(object.tag, XmlTags.TEXT):
+        if object.xml_tag is XmlTags.TEXT:
             self.current_instance.value = object.text
             self._stage = RowPipelineStage.idle
 
     def _handle_set_model_value(self, object: XmlDataObject):
-        if XmlTags.is_match(object.tag, XmlTags.VALUE_TYPE) or XmlTags.is_match(
-            object.tag, XmlTags.CONTENT_TYPE
-        ):
+        xml_tag = object.xml_tag
+        if xml_tag is XmlTags.VALUE_TYPE or xml_tag is XmlTags.CONTENT_TYPE:
             self.current_instance.value_type = object.text
-        if XmlTags.is_match(object.tag, XmlTags.VALUE):
+        if xml_tag is XmlTags.VALUE:
             self.current_instance.value = object.text
         self._stage = RowPipelineStage.idle
 
@@ -149,7 +147,12 @@ class XmlRowBuilder(ModelBuilder):
         self.current_instance.index = idx
         self.current_instance.depth = object.level
         self.current_instance.id_short = object.text
-        self.current_instance.model_type = object.parent.tag.replace(_AAS_KEY, "")
+        self._model_tag = object.parent_xml_tag
+        self.current_instance.model_type = (
+            self._model_tag.value
+            if self._model_tag is not None
+            else object.parent_tag.replace(_AAS_KEY, "")
+        )
         self._stage = RowPipelineStage.idle
 
     def _handle_set_submodel_id(self, object: XmlDataObject):
@@ -159,6 +162,7 @@ class XmlRowBuilder(ModelBuilder):
     def _handle_flush(self):
         self.committed_instance = copy.deepcopy(self.current_instance)
         self.current_instance = RowModel()
+        self._model_tag = None
         self._stage = RowPipelineStage.idle
 
 
@@ -190,7 +194,7 @@ class XmlConceptDescriptionBuilder(ModelBuilder):
 
     def is_committed(self, object: XmlDataObject) -> bool:
         if not self.committed_instance.is_empty:
-            if XmlTags.is_match(object.tag, XmlTags.CONCEPT_DESCRIPTION):
+            if object.xml_tag is XmlTags.CONCEPT_DESCRIPTION:
                 return True
         return False
 
@@ -198,21 +202,23 @@ class XmlConceptDescriptionBuilder(ModelBuilder):
         continue_: bool = True
         break_: bool = False
 
-        if XmlTags.is_match(object.tag, XmlTags.CONCEPT_DESCRIPTION):
+        xml_tag = object.xml_tag
+
+        if xml_tag is XmlTags.CONCEPT_DESCRIPTION:
             if not self.current_instance.is_empty:
                 self._stage = ConceptDescriptionPipelineStage.flush
                 return continue_
             return break_
 
-        if XmlTags.is_match(object.tag, XmlTags.ID_SHORT):
+        if xml_tag is XmlTags.ID_SHORT:
             self.current_instance.id_short = object.text
             return break_
 
-        if XmlTags.is_match(object.tag, XmlTags.ID):
+        if xml_tag is XmlTags.ID:
             self.current_instance.id = object.text
             return break_
 
-        if XmlTags.is_match(object.tag, XmlTags.DEFINITION):
+        if xml_tag is XmlTags.DEFINITION:
             self._stage = ConceptDescriptionPipelineStage.set_definition
             return break_
 
@@ -223,8 +229,9 @@ class XmlConceptDescriptionBuilder(ModelBuilder):
         return break_
 
     def _handle_set_definition(self, object: XmlDataObject):
-        if XmlTags.is_match(object.tag, XmlTags.TEXT) and XmlTags.is_match(
-            object.parent.tag, XmlTags.LANG_STRING_DEFINITION_TYPE_IEC_61360
+        if (
+            object.xml_tag is XmlTags.TEXT
+            and object.parent_xml_tag is XmlTags.LANG_STRING_DEFINITION_TYPE_IEC_61360
         ):
             self.current_instance.definition = object.text
         self._stage = ConceptDescriptionPipelineStage.idle
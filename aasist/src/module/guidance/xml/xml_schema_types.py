@@ -1,10 +1,15 @@
 from enum import Enum
-from typing import Iterable, Union
+from typing import Dict, Iterable, Optional, Union
+
+from aasist.src.module.guidance.schema_types import ParentElement, simple_model_type
 
 
 _XML_KEY_MAP = {"aas": "https://admin-shell.io/aas/3/0"}
 _AAS_KEY = "{" + _XML_KEY_MAP["aas"] + "}"
 
+# namespace prefix -> {lxml tag: XmlTags}, 네임스페이스별로 한 번만 생성
+_TAG_TABLES: Dict[str, Dict[str, "XmlTags"]] = {}
+
 
 class XmlTags(Enum):
     KIND = "kind"
@@ -112,6 +117,26 @@ class XmlTags(Enum):
     SUBMODEL = "submodel"
     SUBMODELS = "submodels"
 
+    @property
+    def is_parent_element(self) -> bool:
+        return self in _PARENT_ELEMENT_TAGS
+
+    @property
+    def simple_name(self) -> str:
+        return _SIMPLE_NAMES[self]
+
+    @classmethod
+    def classify(cls, tag: Optional[str], prefix: str = _AAS_KEY) -> Optional["XmlTags"]:
+        """
+        O(1) lookup of a qualified (or bare) lxml tag; None for unknown tags
+        """
+        table = _TAG_TABLES.get(prefix)
+        if table is None:
+            table = {member.value: member for member in cls}
+            table.update({prefix + member.value: member for member in cls})
+            _TAG_TABLES[prefix] = table
+        return table.get(tag)
+
     @classmethod
     def is_match(
         cls,
@@ -121,11 +146,19 @@ class XmlTags(Enum):
     ) -> bool:
         if tag is None:
             return False
-        stripped = tag.replace(prefix, "")
+        member = cls.classify(tag, prefix)
+        if member is None:
+            return False
         try:
             if isinstance(check, XmlTags):
-                return stripped == check.value
+                return member is check
             if isinstance(check, Iterable):
-                return any(stripped == item.value for item in check)
+                return member in check
         except TypeError:
             return False
+
+
+_PARENT_ELEMENT_TAGS = frozenset(
+    member for member in XmlTags if ParentElement.contains(member.value)
+)
+_SIMPLE_NAMES = {member: simple_model_type(member.value) for member in XmlTags}
@@ -1,15 +1,15 @@
+import bisect
+from dataclasses import fields
+import itertools
 import logging
 import traceback
-from types import SimpleNamespace
-from typing import Any, Dict, Iterable, List, Tuple
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
 
 from aasist.src.gui.handler import _GUIDANCE_LOG_NAME, LogLevel, QueueHandler
 from aasist.src.module.guidance.schema_types import (
-    SIMPLE_MODEL_TYPES,
     ParentElement,
     TableFormat,
+    simple_model_type,
 )
 from aasist.src.module.guidance.submodel_table_extractor import (
     DefaultSubmodel,
@@ -29,10 +29,17 @@ from aasist.src.module.guidance.xml.xml_table_parser import (
 from aasist.src.module.guidance.submodel_table_model import (
     ConceptDescriptionModel,
     RowModel,
+    SubmodelTable,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# RowModel.to_dict 열 순서
+_ROW_COLUMNS = [field.name.lstrip("_") for field in fields(RowModel)]
+
 
 class XmlTableExtractor(SubmodelTableExtractor):
 
@@ -51,7 +58,6 @@ class XmlTableExtractor(SubmodelTableExtractor):
             log_handler=QueueHandler(_GUIDANCE_LOG_NAME),
         )
         self._file_name = file_name
-        self._xml_object_store: Dict[str : Tuple[str, Iterable[XmlDataObject]]] = {}
         self._submodel_store: Dict[str : Iterable[RowModel]] = {}
         self._header = {
             "id_short": "idShort",
@@ -64,6 +70,8 @@ class XmlTableExtractor(SubmodelTableExtractor):
             "definition": "정의",
         }
         self._cd_store: List[ConceptDescriptionModel] = []
+        self._cd_index: Dict[Tuple[str, str], ConceptDescriptionModel] = {}
+        self._cd_semantic_index: Dict[str, ConceptDescriptionModel] = {}
         self.log_handler = QueueHandler(_GUIDANCE_LOG_NAME)
         self.use_simple_model_type: bool = kwargs.get("use_simple_model_type")
         self.hide_depth_attributes: bool = kwargs.get("hide_depth_attributes")
@@ -95,79 +103,71 @@ class XmlTableExtractor(SubmodelTableExtractor):
                 if shell is None:
                     continue
                 key = f"{shell}_{parent}"
-                self._xml_object_store[key] = children
                 self.log_handler.add(f"Start extracting Submodel: {key}")
+                # 서브모델 단위로 바로 row 생성 (요소 목록을 쌓아두지 않음)
+                self._submodel_store[key] = self._build_rows(children)
 
+    def _build_rows(self, submodel: Iterable[XmlDataObject]) -> List[RowModel]:
         row_builder = XmlRowBuilder()
         rows: List[RowModel] = []
 
-        for key, submodel in self._xml_object_store.items():
-            rows = []
-            row_builder.__init__()
-
-            for i, submodel_element in enumerate(submodel):
-                submodel_element: XmlDataObject
-                row_builder.handle(submodel_element, idx=i)
-                if row_builder.is_committed(submodel_element):
-                    cd: ConceptDescriptionModel = self._find_concept_description(
-                        row_builder.committed_instance.id_short,
-                        row_builder.committed_instance.semantic_id,
-                    )
-                    row_builder.committed_instance.definition = (
-                        cd.definition if cd else None
-                    )
-                    rows.append(row_builder.committed_instance)
-
-            if not row_builder.current_instance.is_empty:
-                rows.append(row_builder.current_instance)
-
-            self._submodel_store[key] = list(rows)
-
-    def _to_dataframes(self) -> Iterable[Tuple[str, pd.DataFrame]]:
-        for key, submodel in self._submodel_store.items():
-            submodel: Iterable[RowModel]
-            to_dicts = [s.to_dict() for s in submodel]
-            for d in to_dicts:
-                d["description"] = (
-                    "\n".join(
-                        str(text) for text in d.get("description", []) if d is not None
-                    )
-                    if isinstance(d.get("description"), list)
-                    else ""
+        for i, submodel_element in enumerate(submodel):
+            submodel_element: XmlDataObject
+            row_builder.handle(submodel_element, idx=i)
+            if row_builder.is_committed(submodel_element):
+                cd: ConceptDescriptionModel = self._find_concept_description(
+                    row_builder.committed_instance.id_short,
+                    row_builder.committed_instance.semantic_id,
                 )
-                d["definition"] = (
-                    "\n".join(
-                        str(text) for text in d.get("definition", []) if d is not None
-                    )
-                    if isinstance(d.get("definition"), list)
-                    else ""
+                row_builder.committed_instance.definition = (
+                    cd.definition if cd else None
                 )
-                if self.use_simple_model_type:
-                    simple_names = {k.lower(): v for k, v in SIMPLE_MODEL_TYPES.items()}
-                    d["model_type"] = simple_names.get(
-                        d["model_type"].lower(), d["model_type"]
-                    )
-
-            df = pd.DataFrame(to_dicts)
-            df = df.dropna(how="all")
-            result_df = self._apply_hierarchy(df)
-            result_df.rename(columns=self._header, inplace=True)
-            result_df.rename(
-                columns={
-                    col: f"SMC{int(col[3:])-1:02d}"
-                    for col in df.columns
-                    if col.startswith("SMC")
-                },
-                inplace=True,
+                rows.append(row_builder.committed_instance)
+
+        if not row_builder.current_instance.is_empty:
+            rows.append(row_builder.current_instance)
+
+        return rows
+
+    def _to_table(self, key: str, submodel: Iterable[RowModel]) -> SubmodelTable:
+        columns: Dict[str, List[Any]] = {name: [] for name in _ROW_COLUMNS}
+        for row in submodel:
+            for name, values in columns.items():
+                values.append(getattr(row, name))
+
+        for name in ("description", "definition"):
+            columns[name] = [
+                "\n".join(str(text) for text in value)
+                if isinstance(value, list)
+                else ""
+                for value in columns[name]
+            ]
+        if self.use_simple_model_type:
+            columns["model_type"] = [
+                simple_model_type(model_type) for model_type in columns["model_type"]
+            ]
+
+        result = self._apply_hierarchy(columns)
+        headers = [
+            (
+                f"SMC{int(name[3:])-1:02d}"
+                if name.startswith("SMC")
+                else self._header.get(name, name)
             )
-            result_df = result_df.iloc[1:, 1:]
-
-            yield (key, result_df)
+            for name in result
+        ]
+
+        # 첫 행/첫 열(최상위 SMC 열) 제외
+        return SubmodelTable(
+            name=key,
+            headers=headers[1:],
+            columns=[values[1:] for values in list(result.values())[1:]],
+        )
 
-    def export(self, format: TableFormat):
+    def export(self, format: TableFormat, **kwargs):
         self.log_handler.add(f"Convert Submodel metadata to {format.name} ...")
         try:
-            super().export(format, log_handler=self.log_handler)
+            super().export(format, log_handler=self.log_handler, **kwargs)
             total_count = len(self._submodel_store)
             self.log_handler.add(
                 f"{self.success_count} of {total_count} Submodels from {self._file_name} exported successfully.",
@@ -184,120 +184,147 @@ class XmlTableExtractor(SubmodelTableExtractor):
                 log_level=LogLevel.ERROR,
             )
 
-    def _apply_hierarchy(self, df: pd.DataFrame) -> pd.DataFrame:
-        df["depth"] = pd.Categorical(
-            df["depth"], categories=sorted(df["depth"].unique()), ordered=True
-        ).codes
-
-        df_ = df.apply(lambda row: SimpleNamespace(**row), axis=1)
+    def _apply_hierarchy(self, columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+        """
+        columns: RowModel fields per column
+        return: SMCxx columns followed by the selected columns, in table order
+        """
+        # numpy는 표를 만들 때만 필요 (GUI/CLI 시작 시 import 하지 않음)
+        import numpy as np
 
-        depth = df["depth"].unique()
+        depth = sorted(set(columns["depth"]))
+        codes = {dp: i for i, dp in enumerate(depth)}
+        columns["depth"] = [codes[dp] for dp in columns["depth"]]
 
         max_depth = len(depth)
-        min_depth = min(dp for dp in depth)
-
-        for i in range(1, max_depth):
-            df[f"SMC{i:02}"] = None
-
-        prev_ancestors: dict[int, Any] = None
-
-        for i, r in enumerate(df_):
-            if r is None:
-                continue
-
-            r.index = i
-
-            if self.hide_depth_attributes:
-                if not self._have_children(r.index, df_):
+        min_depth = min(columns["depth"])
+
+        row_count = len(columns["depth"])
+        depths = np.array(columns["depth"], dtype=np.int64)
+        id_shorts = np.empty(row_count, dtype=object)
+        id_shorts[:] = columns["id_short"]
+        is_parent = np.fromiter(
+            (ParentElement.contains(model_type) for model_type in columns["model_type"]),
+            dtype=bool,
+            count=row_count,
+        )
+        parents, ancestor_paths = self._hierarchy(
+            depths, is_parent, max_depth, with_ancestors=self.hide_depth_attributes
+        )
 
-                    all_ancestors = list(self._find_all_ancestors(r.index, df_))
+        # SMC 열 값 (열 번호 -> 행별 값), max_depth 열은 값이 있을 때만 생성
+        smc_values = {
+            i: np.full(row_count, None, dtype=object) for i in range(1, max_depth + 1)
+        }
+        written = np.zeros(max_depth + 1, dtype=bool)
+        written[1:max_depth] = True
 
-                    if not all_ancestors or (
-                        self._find_parent(r.index, df_) < 0 and r.depth == min_depth
-                    ):
-                        df.at[r.index, f"SMC{r.depth+1:02}"] = "-"
-                        continue
+        if self.hide_depth_attributes:
+            have_children = np.zeros(row_count, dtype=bool)
+            have_children[:-1] = depths[:-1] < depths[1:]
 
-                    seen = set()
-                    current_ancestors = {
-                        d: a.id_short
-                        for d, a in all_ancestors
-                        if (d not in seen and not seen.add(d))
-                    }
+            prev_ancestors: dict[int, Any] = None
 
-                    if not prev_ancestors:
-                        prev_ancestors = current_ancestors.copy()
+            for i in np.flatnonzero(~have_children):
+                path = ancestor_paths[i, : depths[i]]
+                current_ancestors = {
+                    int(d): id_shorts[a] for d, a in enumerate(path) if a >= 0
+                }
 
-                    if (
-                        ParentElement.contains(df_[r.index - 1].model_type)
-                        or r.index == 0
-                        or prev_ancestors != current_ancestors
-                    ):
-                        for depth, ancestor in current_ancestors.items():
-                            df.at[r.index, f"SMC{depth+1:02}"] = ancestor
+                if not current_ancestors:
+                    smc_values[depths[i] + 1][i] = "-"
+                    written[depths[i] + 1] = True
+                    continue
 
+                if not prev_ancestors:
                     prev_ancestors = current_ancestors.copy()
 
-                elif ParentElement.contains(r.model_type):
-                    df.loc[r.index] = None
-                    df.at[r.index, f"SMC{r.depth+1:02}"] = r.id_short
-
+                if (
+                    is_parent[i - 1]
+                    or i == 0
+                    or prev_ancestors != current_ancestors
+                ):
+                    for d, ancestor in current_ancestors.items():
+                        smc_values[d + 1][i] = ancestor
+
+                prev_ancestors = current_ancestors.copy()
+
+            # 자식이 있는 부모 요소 행과 idShort 없는 행은 제외
+            keep = ~(have_children & is_parent) & np.not_equal(id_shorts, None)
+        else:
+            top = ~is_parent & (depths == min_depth)
+            child = ~is_parent & ~top & (parents >= 0)
+            for i, values in smc_values.items():
+                own = (is_parent | top) & (depths + 1 == i)
+                values[own & is_parent] = id_shorts[own & is_parent]
+                values[own & top] = "-"
+                of_parent = child & (depths == i)
+                values[of_parent] = id_shorts[parents[of_parent]]
+                written[i] |= own.any() or of_parent.any()
+            keep = np.ones(row_count, dtype=bool)
+
+        selected = list(columns) if not self.columns else self.columns
+        result: Dict[str, List[Any]] = {
+            f"SMC{i:02}": values[keep].tolist()
+            for i, values in smc_values.items()
+            if written[i]
+        }
+        for name in selected:
+            if name in ("depth", "index"):
                 continue
+            values = np.empty(row_count, dtype=object)
+            values[:] = columns[name]
+            result[name] = values[keep].tolist()
+        return result
 
-            if ParentElement.contains(r.model_type):
-                df.at[r.index, f"SMC{r.depth+1:02}"] = r.id_short
-            elif r.depth == min_depth:
-                df.at[r.index, f"SMC{r.depth+1:02}"] = "-"
-            else:
-                parent_idx = self._find_parent(r.index, df_)
-                if parent_idx >= 0:
-                    df.at[r.index, f"SMC{r.depth:02}"] = df_[parent_idx].id_short
+    def _hierarchy(
+        self,
+        depths: "np.ndarray",
+        is_parent: "np.ndarray",
+        max_depth: int,
+        with_ancestors: bool = False,
+    ) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+        """
+        Single pass over the rows.
+        parents[i]: nearest previous parent element row with a smaller depth (-1 if none)
+        ancestor_paths[i, d]: nearest previous parent element row at depth d,
+        searched back to the last top level row (-1 if none)
+        """
+        import numpy as np
+
+        parents = np.full(len(depths), -1, dtype=np.int64)
+        ancestor_paths = (
+            np.full((len(depths), max(max_depth, 1)), -1, dtype=np.int64)
+            if with_ancestors
+            else None
+        )
 
-        group_columns = [col for col in df.columns if col.startswith("SMC")]
-        other_columns = [col for col in df.columns if col not in group_columns]
+        # 깊이가 증가하는 부모 요소 스택
+        stack_depths: List[int] = []
+        stack_rows: List[int] = []
+        last_parents = np.full(max(max_depth, 1), -1, dtype=np.int64)
 
-        df = df[group_columns + (other_columns if not self.columns else self.columns)]
-        df = df.copy()
-        if self.hide_depth_attributes:
-            df = df[~df["id_short"].isna()]
-        df.drop(["depth", "index"], axis=1, inplace=True, errors="ignore")
-        return df
-
-    def _have_children(self, start: int, df_: pd.DataFrame) -> bool:
-        current_depth = df_[start].depth
-        for i in range(start + 1, len(df_)):
-            if current_depth < df_[i].depth:
-                return True
-            else:
-                return False
-        return False
-
-    def _find_all_ancestors(
-        self, start: int, df_: pd.DataFrame, min_depth: int = 0
-    ) -> Iterable[Tuple[int, SimpleNamespace]]:
-        if start <= 0:
-            return
-        current_depth = df_[start].depth
-        for i in range(start - 1, -1, -1):
-            if current_depth > df_[i].depth and ParentElement.contains(
-                df_[i].model_type
-            ):
-                yield (df_[i].depth, df_[i])
-            if df_[i].depth == min_depth:
-                return
+        for i, (depth, parent) in enumerate(zip(depths.tolist(), is_parent.tolist())):
+            found = bisect.bisect_left(stack_depths, depth)
+            if found > 0:
+                parents[i] = stack_rows[found - 1]
 
-    def _find_parent(self, start: int, df_: pd.DataFrame) -> int:
-        if start <= 0:
-            return -1
-        current_depth = df_[start].depth
-        for i in range(start - 1, -1, -1):
-            if current_depth > df_[i].depth and ParentElement.contains(
-                df_[i].model_type
-            ):
-                return i
-        return -1
+            if with_ancestors:
+                ancestor_paths[i] = last_parents
+                if depth == 0:
+                    last_parents[:] = -1
+
+            if parent:
+                while stack_depths and stack_depths[-1] >= depth:
+                    stack_depths.pop()
+                    stack_rows.pop()
+                stack_depths.append(depth)
+                stack_rows.append(i)
+                last_parents[depth] = i
+
+        return parents, ancestor_paths
 
-    def _match_submodel_elements(self, submodels: List[XmlDataObject]):
+    def _match_submodel_elements(self, submodels: Iterable[XmlDataObject]):
         try:
             identifier_map: Dict[str, Tuple[str, ParseObjectIdentifier]] = {
                 identifier.id: (key, identifier)
@@ -305,7 +332,13 @@ class XmlTableExtractor(SubmodelTableExtractor):
                 for identifier in identifiers
             }
 
-            submodel_level = min(submodel.level for submodel in submodels)
+            # streaming 모드에서는 한 번만 순회 가능 - 첫 요소(서브모델)의 level 사용
+            submodels = iter(submodels)
+            first = next(submodels, None)
+            if first is None:
+                return
+            submodel_level = first.level
+            submodels = itertools.chain([first], submodels)
 
             children: List[XmlDataObject] = []
 
@@ -324,7 +357,7 @@ class XmlTableExtractor(SubmodelTableExtractor):
 
                     continue
 
-                if XmlTags.is_match(submodel.tag, XmlTags.ID):
+                if submodel.xml_tag is XmlTags.ID:
                     identifier: ParseObjectIdentifier
 
                     current_submodel = identifier_map.get(submodel.text)
@@ -342,6 +375,8 @@ class XmlTableExtractor(SubmodelTableExtractor):
 
     def _assemble_concept_descriptions(self, concept_descriptions: List[XmlDataObject]):
         self._cd_store = []
+        self._cd_index = {}
+        self._cd_semantic_index = {}
 
         cd_builder: XmlConceptDescriptionBuilder = XmlConceptDescriptionBuilder()
         cds: List[ConceptDescriptionModel] = []
@@ -350,20 +385,23 @@ class XmlTableExtractor(SubmodelTableExtractor):
             cd_builder.handle(cd)
             if cd_builder.is_committed(cd):
                 cds.append(cd_builder.committed_instance)
-                continue
 
-            if not cd_builder.current_instance.is_empty:
-                cds.append(cd_builder.current_instance)
+        if not cd_builder.current_instance.is_empty:
+            cds.append(cd_builder.current_instance)
+
+        # 여러 AAS가 같은 CD를 참조할 수 있으므로 소비하지 않는 인덱스로 조회
+        for cd in cds:
+            self._cd_index.setdefault((cd.id_short, cd.id), cd)
+            self._cd_semantic_index.setdefault(cd.id, cd)
 
-        self._cd_store = cds.copy()
+        self._cd_store = cds
 
     def _find_concept_description(
         self,
         id_short: str,
         semantic_id: str,
     ) -> ConceptDescriptionModel | None:
-        for i, cd in enumerate(self._cd_store):
-            if cd.id_short == id_short and cd.id == semantic_id:
-                # TODO: AAS 여러개일때 definition 추출 안되는 이슈 수정
-                return self._cd_store.pop(i)
-        return None
+        cd = self._cd_index.get((id_short, semantic_id))
+        if cd is None and semantic_id is not None:
+            cd = self._cd_semantic_index.get(semantic_id)
+        return cd
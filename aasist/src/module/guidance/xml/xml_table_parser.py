@@ -1,6 +1,16 @@
-import copy
 import logging
-from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple
+from array import array
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 from lxml import etree
 from aasist.src.gui.handler import _GUIDANCE_LOG_NAME, QueueHandler
 from aasist.src.module.guidance.submodel_table_parser import (
@@ -25,6 +35,21 @@ class XmlDataObject(ParseObject):
         self.tag = element.tag
         self.text = element.text
         self.parent: Optional[etree._Element] = element.getparent()
+        self.parent_tag: Optional[str] = (
+            self.parent.tag if self.parent is not None else None
+        )
+
+    @property
+    def has_children(self) -> bool:
+        return bool(self.children)
+
+    @property
+    def xml_tag(self) -> Optional[XmlTags]:
+        return XmlTags.classify(self.tag)
+
+    @property
+    def parent_xml_tag(self) -> Optional[XmlTags]:
+        return XmlTags.classify(self.parent_tag)
 
     def __repr__(self):
         return f"""{"-" * self.level}> XmlObject(index={self.index}, level={self.level}, tag={self.tag}, text={self.text}, parent={self.parent.tag})"""
@@ -52,28 +77,242 @@ class XmlDataObject(ParseObject):
         return self._cached_hash
 
 
+class XmlStreamObject(ParseObject):
+    """
+    Detached counterpart of XmlDataObject emitted by the streaming parse.
+    Keeps no reference to the lxml element, so consumed elements can be cleared.
+    """
+
+    __slots__ = (
+        "index",
+        "tag",
+        "text",
+        "parent_tag",
+        "has_children",
+        "xml_tag",
+        "parent_xml_tag",
+    )
+
+    def __init__(
+        self,
+        tag: str,
+        text: Optional[str],
+        parent_tag: Optional[str],
+        level: int = 0,
+        index: int = 0,
+        has_children: bool = False,
+    ):
+        super().__init__(level=level, children=())
+        self.index = index
+        self.tag = tag
+        self.text = text
+        self.parent_tag = parent_tag
+        self.has_children = has_children
+        self.xml_tag: Optional[XmlTags] = XmlTags.classify(tag)
+        self.parent_xml_tag: Optional[XmlTags] = XmlTags.classify(parent_tag)
+
+    def __repr__(self):
+        return f"""{"-" * self.level}> XmlStreamObject(index={self.index}, level={self.level}, tag={self.tag}, text={self.text}, parent={self.parent_tag})"""
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, XmlStreamObject):
+            return False
+        return (
+            self.tag == other.tag
+            and self.text == other.text
+            and self.level == other.level
+            and self.index == other.index
+            and self.parent_tag == other.parent_tag
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.tag, self.text, self.level, self.index, self.parent_tag))
+
+
+class XmlNodeTable:
+    """
+    Struct-of-arrays store of the elements below one top-level section.
+    Tags and texts are interned into pools; per node only int32 columns are kept
+    (tag id, level, parent, text id, first child, next sibling; -1 = none).
+    """
+
+    def __init__(self, section_tag: Optional[str] = None):
+        self.section_tag = section_tag
+        self.tags: List[str] = []
+        self.xml_tags: List[Optional[XmlTags]] = []  # tag id -> XmlTags
+        self.texts: List[str] = []
+        self.tag_ids = array("i")
+        self.levels = array("i")
+        self.parents = array("i")
+        self.text_ids = array("i")
+        self.first_children = array("i")
+        self.next_siblings = array("i")
+        self._tag_pool: Dict[str, int] = {}
+        self._text_pool: Dict[str, int] = {}
+        self._path: List[int] = []  # last node index per level while building
+
+    def append(self, tag: str, text: Optional[str], level: int) -> int:
+        """
+        Appends a node in document (pre-order) order; level 1 = child of the section.
+        """
+        index = len(self.tag_ids)
+
+        tag_id = self._tag_pool.get(tag)
+        if tag_id is None:
+            tag_id = self._tag_pool[tag] = len(self.tags)
+            self.tags.append(tag)
+            self.xml_tags.append(XmlTags.classify(tag))
+
+        text_id = -1
+        if text is not None:
+            text_id = self._text_pool.get(text)
+            if text_id is None:
+                text_id = self._text_pool[text] = len(self.texts)
+                self.texts.append(text)
+
+        path = self._path
+        parent = path[level - 2] if level > 1 else -1
+        if len(path) >= level:
+            # 같은 level의 마지막 노드 = 이전 형제
+            self.next_siblings[path[level - 1]] = index
+            del path[level - 1 :]
+        elif parent >= 0:
+            self.first_children[parent] = index
+        path.append(index)
+
+        self.tag_ids.append(tag_id)
+        self.levels.append(level)
+        self.parents.append(parent)
+        self.text_ids.append(text_id)
+        self.first_children.append(-1)
+        self.next_siblings.append(-1)
+        return index
+
+    def node(self, index: int) -> "XmlNode":
+        return XmlNode(self, index)
+
+    def tag(self, index: int) -> str:
+        return self.tags[self.tag_ids[index]]
+
+    def text(self, index: int) -> Optional[str]:
+        text_id = self.text_ids[index]
+        return self.texts[text_id] if text_id >= 0 else None
+
+    def parent_tag(self, index: int) -> Optional[str]:
+        parent = self.parents[index]
+        return self.tags[self.tag_ids[parent]] if parent >= 0 else self.section_tag
+
+    def xml_tag(self, index: int) -> Optional[XmlTags]:
+        return self.xml_tags[self.tag_ids[index]]
+
+    def parent_xml_tag(self, index: int) -> Optional[XmlTags]:
+        parent = self.parents[index]
+        if parent >= 0:
+            return self.xml_tags[self.tag_ids[parent]]
+        return XmlTags.classify(self.section_tag)
+
+    def iter_children(self, index: int) -> Iterator[int]:
+        child = self.first_children[index]
+        while child >= 0:
+            yield child
+            child = self.next_siblings[child]
+
+    def __len__(self) -> int:
+        return len(self.tag_ids)
+
+    def __iter__(self) -> Iterator["XmlNode"]:
+        for index in range(len(self.tag_ids)):
+            yield XmlNode(self, index)
+
+
+class XmlNode(ParseObject):
+    """
+    Flyweight view of one XmlNodeTable row with the XmlDataObject attributes the builders read.
+    """
+
+    __slots__ = ("_table", "index")
+
+    def __init__(self, table: XmlNodeTable, index: int):
+        super().__init__(level=table.levels[index], children=())
+        self._table = table
+        self.index = index
+
+    @property
+    def tag(self) -> str:
+        return self._table.tag(self.index)
+
+    @property
+    def text(self) -> Optional[str]:
+        return self._table.text(self.index)
+
+    @property
+    def parent_tag(self) -> Optional[str]:
+        return self._table.parent_tag(self.index)
+
+    @property
+    def has_children(self) -> bool:
+        return self._table.first_children[self.index] >= 0
+
+    @property
+    def xml_tag(self) -> Optional[XmlTags]:
+        return self._table.xml_tag(self.index)
+
+    @property
+    def parent_xml_tag(self) -> Optional[XmlTags]:
+        return self._table.parent_xml_tag(self.index)
+
+    def __repr__(self):
+        return f"""{"-" * self.level}> XmlNode(index={self.index}, level={self.level}, tag={self.tag}, text={self.text}, parent={self.parent_tag})"""
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, XmlNode):
+            return False
+        return self._table is other._table and self.index == other.index
+
+    def __hash__(self) -> int:
+        return hash((id(self._table), self.index))
+
+
+class _XmlStreamSection:
+    """
+    Re-iterable view over one top-level section of the environment.
+    Every iteration streams the section again instead of keeping it in memory,
+    re-reading the file from the start up to the end of the section.
+    Iterations share the parser's file, so only one may be active at a time.
+    """
+
+    def __init__(self, parser: "XmlTableParser", section: "XmlTags"):
+        self._parser = parser
+        self._section = section
+
+    def __iter__(self) -> Iterator[XmlStreamObject]:
+        return self._parser._stream_elements(self._section)
+
+
 class XmlTableParser(SubmodelTableParser):
 
     def __init__(self, file: IO):
         super().__init__(file=file)
         self.bin: IO = file
-        self._objects: List[XmlDataObject] = []
-        self._definitions: List[XmlDataObject] = []
+        self._objects: Iterable[ParseObject] = []
+        self._definitions: Iterable[ParseObject] = []
         self._submodel_identifiers: Dict[str : List[ParseObjectIdentifier]] = {}
+        self._streaming_section: Optional[XmlTags] = None
 
     def parse_submodels(self, **kwargs: Any):
-        self._objects: List[XmlDataObject] = []
+        self._objects: Iterable[ParseObject] = []
         self._root_submodels: List[str] = []
 
+        if kwargs.get("streaming", False):
+            self._parse_submodels_streaming()
+            return
+
         document = self.parse_xml()
 
         if document is None:
             logger.error("failed to parse xml")
             return None
 
-        submodel_elements: List[XmlDataObject] = []
-        concept_description_elements: List[XmlDataObject] = []
-
         aas_submodels = document.find(_AAS_KEY + XmlTags.SUBMODELS.value)
 
         # just for logging
@@ -87,59 +326,162 @@ class XmlTableParser(SubmodelTableParser):
             log_handler.add(f"Assemble Asset Administration Shell...: {aas.text}")
 
         # set submodel identifier
-        identifier = ParseObjectIdentifier()
-        submodel_id_with_shell = self._submodel_id_group_by_shell(aas_shells)
+        shell_by_submodel_id = self._submodel_id_group_by_shell(
+            (element.tag, element.text, self._previous_tag(element))
+            for element in (aas_shells.iter() if aas_shells is not None else [])
+        )
         is_submodel = lambda e: (
             XmlTags.is_match(e.getparent().tag, XmlTags.SUBMODEL)
             and XmlTags.is_match(e.tag, [XmlTags.ID_SHORT, XmlTags.ID])
         )
 
-        for tag, submodel in self._find_elements_by_condition(
-            aas_submodels, is_submodel
-        ):
-            submodel: etree._Element
-            if XmlTags.is_match(tag, XmlTags.ID_SHORT):
-                identifier.id_short = submodel.text
-            elif XmlTags.is_match(tag, XmlTags.ID):
-                identifier.id = submodel.text
-                key = next(
-                    (
-                        key
-                        for key, value in submodel_id_with_shell.items()
-                        if submodel.text in value
-                    ),
-                    None,
+        self._set_submodel_identifiers(
+            (
+                (tag, submodel.text)
+                for tag, submodel in self._find_elements_by_condition(
+                    aas_submodels, is_submodel
                 )
-                if key not in self._submodel_identifiers:
-                    self._submodel_identifiers[key] = []
-                self._submodel_identifiers[key].append(copy.deepcopy(identifier))
-                identifier.__init__()
-
-        # submodels
-        index_key = 0
-
-        for submodel, level in self._iterate_elements(aas_submodels, 0):
-            data_object = self._element_to_object(submodel, level, index_key)
-            if data_object is None:
-                continue
-            submodel_elements.append(data_object)
-            index_key += 1
+            ),
+            shell_by_submodel_id,
+        )
 
         # concept descriptions
         concept_descriptions = document.find(
             _AAS_KEY + XmlTags.CONCEPT_DESCRIPTIONS.value
         )
 
-        for i, (cd, level) in enumerate(
-            self._iterate_elements(concept_descriptions, 0)
-        ):
-            desc_object = self._element_to_object(cd, level, i)
-            if desc_object is None:
-                continue
-            concept_description_elements.append(desc_object)
+        self._objects = self._to_node_table(aas_submodels)
+        self._definitions = self._to_node_table(concept_descriptions)
+
+    def _parse_submodels_streaming(self):
+        """
+        Streaming counterpart of parse_submodels: nothing is kept but the identifiers.
+        Costs two passes here (shells, submodel identifiers) and two more when the
+        extractor reads _definitions and _objects, each parsing the file from the
+        start up to the end of its section. The submodels section is parsed twice.
+        """
+        log_handler = QueueHandler(_GUIDANCE_LOG_NAME)
+        shell_elements: List[Tuple[str, Optional[str], Optional[str]]] = []
+        previous_tags: Dict[int, str] = {}
+
+        for object in self._stream_elements(XmlTags.ASSET_ADMINISTRATION_SHELLS):
+            # previous sibling is the last element seen on the same level
+            for level in [level for level in previous_tags if level > object.level]:
+                del previous_tags[level]
+            shell_elements.append(
+                (object.tag, object.text, previous_tags.get(object.level))
+            )
+            previous_tags[object.level] = object.tag
+            if object.xml_tag is XmlTags.ID_SHORT:
+                log_handler.add(f"Assemble Asset Administration Shell...: {object.text}")
+
+        shell_by_submodel_id = self._submodel_id_group_by_shell(shell_elements)
+        self._set_submodel_identifiers(
+            (
+                (object.tag, object.text)
+                for object in self._stream_elements(XmlTags.SUBMODELS)
+                if object.parent_xml_tag is XmlTags.SUBMODEL
+                and object.xml_tag in (XmlTags.ID_SHORT, XmlTags.ID)
+            ),
+            shell_by_submodel_id,
+        )
+
+        self._objects = _XmlStreamSection(self, XmlTags.SUBMODELS)
+        self._definitions = _XmlStreamSection(self, XmlTags.CONCEPT_DESCRIPTIONS)
+
+    def _set_submodel_identifiers(
+        self,
+        elements: Iterable[Tuple[str, Optional[str]]],
+        shell_by_submodel_id: Dict[str, str],
+    ):
+        id_short: Optional[str] = None
+
+        for tag, text in elements:
+            xml_tag = XmlTags.classify(tag)
+            if xml_tag is XmlTags.ID_SHORT:
+                id_short = text
+            elif xml_tag is XmlTags.ID:
+                key = shell_by_submodel_id.get(text)
+                if key not in self._submodel_identifiers:
+                    self._submodel_identifiers[key] = []
+                self._submodel_identifiers[key].append(
+                    ParseObjectIdentifier(id=text, id_short=id_short)
+                )
 
-        self._objects = list(submodel_elements)
-        self._definitions = list(concept_description_elements)
+    def _stream_elements(self, section: XmlTags) -> Iterator[XmlStreamObject]:
+        """
+        Streams the elements below a top-level section in document order with iterparse.
+        An element is emitted once its text is complete (first child start or own end)
+        and cleared after its end event, so only the open branch stays in memory.
+        Every call rewinds self.bin, so a second stream started while another is still
+        being consumed would move its file position: that raises RuntimeError instead.
+        """
+        if self._streaming_section is not None:
+            raise RuntimeError(
+                f"cannot stream {section.name} while {self._streaming_section.name} "
+                "is still being streamed from the same file"
+            )
+        section_tag = _AAS_KEY + section.value
+        open_tags: List[str] = []  # section and its open descendants
+        pending: Optional[Tuple[etree._Element, int, str]] = None
+        depth = 0
+        index = 0
+
+        self._streaming_section = section
+        self.bin.seek(0)
+        events = etree.iterparse(
+            self.bin,
+            events=("start", "end"),
+            remove_blank_text=True,
+            remove_comments=True,
+        )
+        try:
+            for event, element in events:
+                if event == "start":
+                    depth += 1
+                    if open_tags:
+                        if pending is not None:
+                            yield self._to_stream_object(pending, index, True)
+                            index += 1
+                        pending = (element, len(open_tags), open_tags[-1])
+                        open_tags.append(element.tag)
+                    elif depth == 2 and element.tag == section_tag:
+                        open_tags.append(element.tag)
+                    continue
+
+                depth -= 1
+                if open_tags:
+                    if pending is not None and pending[0] is element:
+                        yield self._to_stream_object(pending, index, False)
+                        index += 1
+                        pending = None
+                    open_tags.pop()
+                    if not open_tags:
+                        return
+
+                element.clear()
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+        except etree.XMLSyntaxError as e:
+            logger.error(f"xml syntax error: {e}")
+        finally:
+            self._streaming_section = None
+
+    def _to_stream_object(
+        self,
+        pending: Tuple[etree._Element, int, str],
+        index: int,
+        has_children: bool,
+    ) -> XmlStreamObject:
+        element, level, parent_tag = pending
+        return XmlStreamObject(
+            tag=element.tag,
+            text=element.text,
+            parent_tag=parent_tag,
+            level=level,
+            index=index,
+            has_children=has_children,
+        )
 
     def parse_xml(self) -> Optional[etree._Element]:
         parser = etree.XMLParser(
@@ -155,55 +497,70 @@ class XmlTableParser(SubmodelTableParser):
 
     def _submodel_id_group_by_shell(
         self,
-        aas_shells: etree._Element,
-    ) -> Dict[str, List[str]]:
+        aas_shells: Iterable[Tuple[str, Optional[str], Optional[str]]],
+    ) -> Dict[str, str]:
+        """
+        aas_shells: (tag, text, previous sibling tag) of every shell element in document order
+        return: submodel id -> idShort of the first shell referencing it
+        """
         identifiers: Dict[str, List[str]] = {}
 
         aas: str = None
 
-        for element in aas_shells.iter():
-            element: etree._Element
-            if XmlTags.is_match(element.tag, XmlTags.ID_SHORT):
+        for tag, text, prev_tag in aas_shells:
+            if XmlTags.classify(tag) is XmlTags.ID_SHORT:
                 if aas is None:
-                    aas = element.text
+                    aas = text
                     identifiers[aas] = []
-                if aas != element.text:
-                    aas = element.text
+                if aas != text:
+                    aas = text
                     identifiers[aas] = []
 
-            if element is None:
-                continue
-
-            prev_element: etree._Element = element.getprevious()
-            if prev_element is None:
+            if prev_tag is None:
                 continue
 
-            if XmlTags.is_match(prev_element.tag, XmlTags.TYPE) and XmlTags.is_match(
-                element.tag, XmlTags.VALUE
+            if (
+                XmlTags.classify(prev_tag) is XmlTags.TYPE
+                and XmlTags.classify(tag) is XmlTags.VALUE
             ):
-                identifiers[aas].append(element.text)
+                identifiers[aas].append(text)
 
-        return identifiers
+        # reverse index (submodel id -> shell)
+        shell_by_submodel_id: Dict[str, str] = {}
+        for aas, submodel_ids in identifiers.items():
+            for submodel_id in submodel_ids:
+                shell_by_submodel_id.setdefault(submodel_id, aas)
 
-    def _element_to_object(
-        self, element: etree._Element, level: int, index: int
-    ) -> XmlDataObject:
-        if element is None:
+        return shell_by_submodel_id
+
+    def _previous_tag(self, element: etree._Element) -> Optional[str]:
+        prev_element: etree._Element = element.getprevious()
+        if prev_element is None:
             return None
-        return XmlDataObject(
-            element=element,
-            level=level,
-            index=index,
-        )
+        return prev_element.tag
+
+    def _to_node_table(self, section: Optional[etree._Element]) -> XmlNodeTable:
+        table = XmlNodeTable(section.tag if section is not None else None)
+        for element, level in self._iterate_elements(section, 0):
+            table.append(element.tag, element.text, level)
+        return table
 
     def _iterate_elements(
         self, element: etree._Element, level: int = 0
     ) -> Iterable[tuple[etree._Element, int]]:
+        """
+        Pre-order walk with an explicit stack of child iterators (no recursion).
+        """
         if element is None:
             return
-        for child in element.iterchildren():
-            yield child, level + 1
-            yield from self._iterate_elements(child, level + 1)
+        stack: List[Iterator[etree._Element]] = [element.iterchildren()]
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            yield child, level + len(stack)
+            stack.append(child.iterchildren())
 
     def _iterate_children(self, element: etree._Element) -> Iterable[etree._Element]:
         if element is None:
@@ -0,0 +1,20 @@
+import asyncio
+from typing import Any, Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+async def run_blocking(func: Callable[..., _T], *args: Any) -> _T:
+    """
+    CPU 작업을 기본 executor 스레드에서 실행 (asyncio.to_thread: contextvars 복사)
+    취소되면 실행 중인 작업이 끝날 때까지 기다린 뒤 취소를 전달
+    (파싱/규칙 패치가 작업보다 먼저 복원되지 않도록)
+    """
+    task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        await asyncio.wait([task])
+        if not task.cancelled():
+            task.exception()  # 취소된 실행의 오류는 버림
+        raise
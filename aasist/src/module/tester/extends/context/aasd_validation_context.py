@@ -1,5 +1,4 @@
-from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from aasist.src.module.tester.extends.context.extends_validation_context import (
     ExtendsValidationContext,
@@ -8,10 +7,6 @@ from aas_test_engines.reflect import TypeBase
 from aas_test_engines.test_cases.v3_0.model import Referable, HasSemantics, DataElement
 
 
-class _AasdContextRules(Enum):
-    parse_concrete_object = "parse_concrete_object"
-
-
 class AasdValidationContext(ExtendsValidationContext):
     _DATA_CLASS = {
         "Referable": Referable,
@@ -20,10 +15,13 @@ class AasdValidationContext(ExtendsValidationContext):
         "AnnotatedRelationshipElement": DataElement,
     }
 
-    def __init__(self):
-        super().__init__()
+    # 모델 클래스별 (제약 메서드 이름, 소속 parents_store 키) 캐시
+    _dispatch: Dict[Type[TypeBase], Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
 
-    def __enter__(self):
+    def __init__(self, reads: Optional[Dict[str, Set[str]]] = None):
+        super().__init__(reads)
+
+    def reset(self):
         self.constraints_store: Dict[str, List[TypeBase]] = {}
         self.parents_store: Dict[str, List[TypeBase]] = {
             "Referable": [],
@@ -31,66 +29,56 @@ class AasdValidationContext(ExtendsValidationContext):
             "DataElement": [],
             "AnnotatedRelationshipElement": [],
         }
-        self._petch_parse()
-        return self
-
-    def _petch_parse(self):
-        from aas_test_engines.test_cases.v3_0 import parse as parse_module
-        from aas_test_engines.reflect import ClassType
-        from aas_test_engines.test_cases.v3_0.adapter import (
-            Adapter,
-            AdapterException,
+        # 클래스별로 construct를 넣을 저장소 목록 (선택된 규칙이 읽는 저장소만)
+        self._targets: Dict[Type[TypeBase], Tuple[List[TypeBase], ...]] = {}
+
+    def collect(self, construct: TypeBase):
+        construct_class = construct.__class__
+        targets = self._targets.get(construct_class, None)
+        if targets is None:
+            targets = self._targets[construct_class] = self._collect_targets(
+                construct_class
+            )
+        for store in targets:
+            store.append(construct)
+
+    def _collect_targets(
+        self, construct_class: Type[TypeBase]
+    ) -> Tuple[List[TypeBase], ...]:
+        dispatch = self._dispatch.get(construct_class, None)
+        if dispatch is None:
+            dispatch = self._dispatch[construct_class] = self._classify(
+                construct_class
+            )
+
+        constraint_methods, parents = dispatch
+        if not constraint_methods:
+            return ()
+
+        targets = []
+        class_name = construct_class.__name__
+        if self._reads("constraints_store", class_name):
+            targets.append(self.constraints_store.setdefault(class_name, []))
+        for data_class in parents:
+            if self._reads("parents_store", data_class):
+                targets.append(self.parents_store[data_class])
+        return tuple(targets)
+
+    @classmethod
+    def _classify(
+        cls, construct_class: Type[TypeBase]
+    ) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        제약 메서드(check_aasd_*)는 클래스에 정의되므로 클래스당 한 번만 조사
+        """
+        constraint_methods = tuple(
+            name
+            for name in dir(construct_class)
+            if "aasd" in name and getattr(construct_class, name) is not None
         )
-        from aas_test_engines.result import AasTestResult
-
-        original_parse_concrete_object = parse_module.parse_concrete_object
-        self.original_methods[_AasdContextRules.parse_concrete_object.value] = (
-            parse_module,
-            "parse_concrete_object",
-            original_parse_concrete_object,
+        parents = tuple(
+            data_class
+            for data_class, base in cls._DATA_CLASS.items()
+            if issubclass(construct_class, base)
         )
-
-        def aasd_parse_concrete_object(
-            cls: ClassType, adapter: Adapter, result: AasTestResult
-        ):
-            try:
-                obj = adapter.as_object()
-            except AdapterException:
-                return parse_module.INVALID
-
-            args = {}
-            all_fields = set()
-            for field in cls.attrs:
-                field_name = field.force_name or parse_module.to_lower_camel_case(
-                    field.name
-                )
-                all_fields.add(field_name)
-                try:
-                    obj_value = obj[field_name]
-                except KeyError:
-                    if field.required:
-                        args[field.name] = parse_module.INVALID
-                    else:
-                        args[field.name] = None
-                    continue
-                args[field.name] = parse_module.parse(field.type, obj_value, result)
-
-            construct = cls.construct(args)
-            check_constraints = [
-                attr
-                for i in dir(construct)
-                if "aasd" in i and (attr := getattr(construct, i)) is not None
-            ]
-
-            if check_constraints:
-                self.constraints_store.setdefault(construct.__class__.__name__, [])
-
-                for data_class in self.parents_store.keys():
-                    if issubclass(construct.__class__, self._DATA_CLASS[data_class]):
-                        self.parents_store[data_class].append(construct)
-
-                self.constraints_store[construct.__class__.__name__].append(construct)
-
-            return cls.construct(args)
-
-        parse_module.parse_concrete_object = aasd_parse_concrete_object
+        return constraint_methods, parents
@@ -0,0 +1,33 @@
+from typing import Optional
+
+from aas_test_engines.reflect import TypeBase
+
+
+class ConstructRecord:
+    """
+    규칙 평가에 필요한 값만 남긴 construct 요약 (전체 객체 그래프를 붙잡지 않음)
+    id_short / id: raw_value 문자열, asset_kind: AssetKind (없으면 None)
+    """
+
+    __slots__ = ("class_name", "id_short", "id", "asset_kind")
+
+    def __init__(
+        self,
+        class_name: str,
+        id_short: Optional[str] = None,
+        id: Optional[str] = None,
+        asset_kind=None,
+    ):
+        self.class_name = class_name
+        self.id_short = id_short
+        self.id = id
+        self.asset_kind = asset_kind
+
+    @classmethod
+    def of(cls, construct: TypeBase) -> "ConstructRecord":
+        return cls(
+            construct.__class__.__name__,
+            id_short=getattr(getattr(construct, "id_short", None), "raw_value", None),
+            id=getattr(getattr(construct, "id", None), "raw_value", None),
+            asset_kind=getattr(construct, "asset_kind", None),
+        )
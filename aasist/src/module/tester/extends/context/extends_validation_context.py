@@ -1,22 +1,92 @@
-from typing import Any, Dict
+from contextlib import ExitStack, contextmanager
+from typing import Any, Dict, Iterator, Optional, Set
+
+from aasist.src.module.tester.extends.context.hooks import (
+    collect_parsed,
+    override_rules,
+)
 
 
 class ExtendsValidationContext:
-    def __init__(self):
-        self.original_methods: Dict[str, Any] = {}
-
-    def _restore_patched_methods(self):
-        for (
-            target_class,
-            method_name,
-            original_method,
-        ) in self.original_methods.values():
-            setattr(target_class, method_name, original_method)
-        self.original_methods.clear()
+    """
+    reads: 선택된 규칙이 읽는 {저장소 이름: 키} (ValidationRegistry.reads) 없으면 모든 저장소 수집
+    """
+
+    def __init__(self, reads: Optional[Dict[str, Set[str]]] = None):
+        self.rule_methods: Dict[str, Any] = {}
+        self.reads = reads
+        self._hooks = ExitStack()
 
     def __enter__(self):
-        pass
+        self.reset()
+        self._hooks.enter_context(collect_parsed(self.collect))
+        self._hooks.enter_context(self.rules())
+        return self
 
     def __exit__(self, exc_type, exc_val, traceback):
-        self._restore_patched_methods()
+        self._hooks.close()
         return False
+
+    def reset(self):
+        """
+        수집 저장소 초기화
+        """
+        pass
+
+    def collect(self, construct: Any):
+        """
+        파싱된 construct 하나를 규칙별 저장소에 분류
+        """
+        pass
+
+    def _reads(self, store: str, key: Optional[str] = None) -> bool:
+        """
+        선택된 규칙이 저장소(의 키)를 읽는지 (읽지 않으면 수집하지 않음)
+        """
+        if self.reads is None:
+            return True
+        keys = self.reads.get(store, None)
+        return keys is not None and (key is None or key in keys)
+
+    def _patch_rules(self):
+        """
+        규칙 재정의 (self.rule_methods에 (대상, 이름, 재정의 규칙) 기록)
+        """
+        pass
+
+    @contextmanager
+    def rules(self) -> Iterator["ExtendsValidationContext"]:
+        """
+        파싱 후크 없이 규칙 재정의만 적용 (공유 파싱 결과로 규칙을 평가할 때 사용)
+        재정의는 현재 문맥(스레드, asyncio 작업)에만 보이므로 다른 검증과 동시에 실행해도 됨
+        """
+        self._patch_rules()
+        try:
+            with override_rules(self.rule_methods.values()):
+                yield self
+        finally:
+            self.rule_methods.clear()
+
+
+class SharedParseValidationContext(ExtendsValidationContext):
+    """
+    한 번의 파싱으로 여러 컨텍스트의 저장소를 함께 채움 (규칙 재정의는 적용하지 않음)
+    """
+
+    def __init__(self, *contexts: ExtendsValidationContext):
+        super().__init__()
+        self.contexts = contexts
+
+    def reset(self):
+        for context in self.contexts:
+            context.reset()
+
+    def collect(self, construct: Any):
+        for context in self.contexts:
+            context.collect(construct)
+
+    def __enter__(self):
+        if self.contexts:
+            self.reset()
+            self._hooks.enter_context(collect_parsed(self.collect))
+        return self
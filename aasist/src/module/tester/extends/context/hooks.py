@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+# aas_test_engines 후크는 프로세스당 한 번만 설치하고,
+# 수집기/규칙 재정의는 ContextVar로 현재 문맥(스레드, asyncio 작업)에만 적용
+# -> 같은 프로세스에서 여러 검증을 동시에 실행해도 서로의 저장소/규칙에 영향을 주지 않음
+
+_HookKey = Tuple[Any, str]
+
+_collector: ContextVar[Optional[Callable[[Any], None]]] = ContextVar(
+    "_collector", default=None
+)
+_overrides: ContextVar[Dict[_HookKey, Callable]] = ContextVar("_overrides", default={})
+
+_installed: Dict[_HookKey, Callable] = {}  # (대상, 이름) -> 원본
+_lock = threading.Lock()
+
+
+def _install_parse_hook():
+    from aas_test_engines.test_cases.v3_0 import parse as parse_module
+
+    key = (parse_module, "parse_concrete_object")
+    with _lock:
+        if key in _installed:
+            return
+        original = parse_module.parse_concrete_object
+        _installed[key] = original
+
+        # 원본 파싱(메타모델 오류 보고 포함)은 그대로 두고 결과만 현재 문맥의 수집기로 전달
+        @wraps(original)
+        def parse_concrete_object(cls, adapter, result):
+            construct = original(cls, adapter, result)
+            collector = _collector.get()
+            if collector is not None and construct is not parse_module.INVALID:
+                collector(construct)
+            return construct
+
+        parse_module.parse_concrete_object = parse_concrete_object
+
+
+def _install_rule_hook(target: Any, name: str):
+    key = (target, name)
+    with _lock:
+        if key in _installed:
+            return
+        original = getattr(target, name)
+        _installed[key] = original
+
+        # 클래스 메서드(self 포함)와 모듈 함수 모두 인자를 그대로 전달
+        @wraps(original)
+        def dispatch(*args, **kwargs):
+            return _overrides.get().get(key, original)(*args, **kwargs)
+
+        setattr(target, name, dispatch)
+
+
+@contextmanager
+def collect_parsed(collector: Callable[[Any], None]) -> Iterator[None]:
+    """
+    이 문맥에서 파싱되는 construct를 collector로 전달
+    """
+    _install_parse_hook()
+    token = _collector.set(collector)
+    try:
+        yield
+    finally:
+        _collector.reset(token)
+
+
+@contextmanager
+def override_rules(
+    overrides: Iterable[Tuple[Any, str, Callable]]
+) -> Iterator[None]:
+    """
+    이 문맥에서만 (대상, 이름)의 규칙을 재정의
+    """
+    overrides = {(target, name): rule for target, name, rule in overrides}
+    for target, name in overrides:
+        _install_rule_hook(target, name)
+    token = _overrides.set({**_overrides.get(), **overrides})
+    try:
+        yield
+    finally:
+        _overrides.reset(token)
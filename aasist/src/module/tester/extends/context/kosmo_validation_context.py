@@ -1,8 +1,10 @@
 from enum import Enum
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Set
+from aasist.src.module.tester.extends.context.construct_record import ConstructRecord
 from aasist.src.module.tester.extends.context.extends_validation_context import (
     ExtendsValidationContext,
 )
+from aas_test_engines.reflect import TypeBase
 from aas_test_engines.test_cases.v3_0.model import (
     Referable,
     Identifiable,
@@ -11,7 +13,6 @@ from aas_test_engines.test_cases.v3_0.model import (
 
 
 class _KosmoContextRules(Enum):
-    parse_concrete_object = "parse_concrete_object"
     aasd_002 = "Referable.check_constraint_aasd_002"
     aasd_007 = "Property.check_aasd_007"
     aasd_117 = "ensure_have_id_shorts"
@@ -19,10 +20,15 @@ class _KosmoContextRules(Enum):
 
 
 class KosmoValidationContext(ExtendsValidationContext):
-    def __init__(self):
-        super().__init__()
+    """
+    전체 construct(referables, asset_informations)는 모델 검사 메서드를 호출하는 규칙이 선택된 경우에만 보관
+    (id/idShort/assetKind만 쓰는 규칙은 ConstructRecord로 평가)
+    """
 
-    def __enter__(self):
+    def __init__(self, reads: Optional[Dict[str, Set[str]]] = None):
+        super().__init__(reads)
+
+    def reset(self):
         self.referables: Dict[str, List[Referable]] = {
             "AssetAdministrationShell": [],
             "Submodel": [],
@@ -30,100 +36,48 @@ class KosmoValidationContext(ExtendsValidationContext):
             "Property": [],
             "ConceptDescription": [],
         }
-        self.identifiables: Dict[str, List[Identifiable]] = {
+        self.identifiables: Dict[str, List[ConstructRecord]] = {
             "AssetAdministrationShell": [],
             "Submodel": [],
             "ConceptDescription": [],
         }
+        self.submodel_records: List[ConstructRecord] = []
         self.asset_informations: List[AssetInformation] = []
-        self._petch_parse()
-        self._petch_kosmo_id_short_rules()
-        self._patch_kosmo_concept_description_rules()
-        return self
-
-    def _petch_parse(self):
-        from aas_test_engines.test_cases.v3_0 import parse as parse_module
-        from aas_test_engines.reflect import ClassType
-        from aas_test_engines.test_cases.v3_0.adapter import (
-            Adapter,
-            AdapterException,
-        )
-        from aas_test_engines.result import AasTestResult
+        self.asset_records: List[ConstructRecord] = []
 
-        original_parse_concrete_object = parse_module.parse_concrete_object
-        self.original_methods[_KosmoContextRules.parse_concrete_object.value] = (
-            parse_module,
-            "parse_concrete_object",
-            original_parse_concrete_object,
-        )
-
-        def kosmo_parse_concrete_object(
-            cls: ClassType, adapter: Adapter, result: AasTestResult
+    def collect(self, construct: TypeBase):
+        # idShort rule - 명명규칙 / Submodel 구성요소 검사
+        if issubclass(construct.__class__, Referable) and getattr(
+            construct.id_short, "raw_value", None
         ):
-            try:
-                obj = adapter.as_object()
-            except AdapterException:
-                return parse_module.INVALID
-
-            args = {}
-            all_fields = set()
-            for field in cls.attrs:
-                field_name = field.force_name or parse_module.to_lower_camel_case(
-                    field.name
-                )
-                all_fields.add(field_name)
-                try:
-                    obj_value = obj[field_name]
-                except KeyError:
-                    if field.required:
-                        args[field.name] = parse_module.INVALID
-                    else:
-                        args[field.name] = None
-                    continue
-                args[field.name] = parse_module.parse(field.type, obj_value, result)
-
-            construct = cls.construct(args)
-
-            # idShort rule - 명명규칙 / Submodel 구성요소 검사
-            if issubclass(construct.__class__, Referable) and getattr(
-                construct.id_short, "raw_value", None
-            ):
-                class_name = construct.__class__.__name__
-                referables = self.referables.get(class_name, None)
-                if referables is not None:
-                    self.referables[class_name].append(construct)
-            # IRDI/IRI 형식 검사
-            if issubclass(construct.__class__, Identifiable):
-                class_name = construct.__class__.__name__
-                identifiables = self.identifiables.get(class_name, None)
-                if identifiables is not None:
-                    self.identifiables[class_name].append(construct)
-            # globalAssetId 검사
-            if isinstance(construct, AssetInformation):
+            class_name = construct.__class__.__name__
+            if class_name == "Submodel" and self._reads("submodel_records"):
+                self.submodel_records.append(ConstructRecord.of(construct))
+            referables = self.referables.get(class_name, None)
+            if referables is not None and self._reads("referables", class_name):
+                self.referables[class_name].append(construct)
+        # IRDI/IRI 형식 검사
+        if issubclass(construct.__class__, Identifiable):
+            class_name = construct.__class__.__name__
+            identifiables = self.identifiables.get(class_name, None)
+            if identifiables is not None and self._reads("identifiables", class_name):
+                self.identifiables[class_name].append(ConstructRecord.of(construct))
+        # globalAssetId / Type 유형 검사
+        if isinstance(construct, AssetInformation):
+            if self._reads("asset_records"):
+                self.asset_records.append(ConstructRecord.of(construct))
+            if self._reads("asset_informations"):
                 self.asset_informations.append(construct)
 
-            return cls.construct(args)
-
-        parse_module.parse_concrete_object = kosmo_parse_concrete_object
+    def _patch_rules(self):
+        self._petch_kosmo_id_short_rules()
+        self._patch_kosmo_concept_description_rules()
 
     def _petch_kosmo_id_short_rules(self):
         from aas_test_engines.test_cases.v3_0 import model as model_module
         from aas_test_engines.test_cases.v3_0.model import Referable, IdShortPath
         import re
 
-        original_check_aasd_002 = Referable.check_constraint_aasd_002
-        self.original_methods[_KosmoContextRules.aasd_002.value] = (
-            Referable,
-            "check_constraint_aasd_002",
-            original_check_aasd_002,
-        )
-        original_ensure_have_id_shorts = model_module.ensure_have_id_shorts
-        self.original_methods[_KosmoContextRules.aasd_117.value] = (
-            model_module,
-            "ensure_have_id_shorts",
-            original_ensure_have_id_shorts,
-        )
-
         def kosmo_id_short_naming_rule(instance) -> Optional[str]:
             if hasattr(instance, "id_short") and hasattr(
                 instance.id_short, "raw_value"
@@ -149,8 +103,16 @@ class KosmoValidationContext(ExtendsValidationContext):
                     msg = f"""The "{val.__class__}" violates the Kosmo rules:\n\r- 다음 항목에 대해 반드시 idShort가 설정되어야 합니다.\n\t1) AssetAdministrationShell\n\t2) Submodel\n\t3) SubmodelElementCollection\n\t4) ConceptDescription\n\t5) Property"""
                     return msg
 
-        model_module.ensure_have_id_shorts = kosmo_id_short_exist_rule
-        Referable.check_constraint_aasd_002 = kosmo_id_short_naming_rule
+        self.rule_methods[_KosmoContextRules.aasd_117.value] = (
+            model_module,
+            "ensure_have_id_shorts",
+            kosmo_id_short_exist_rule,
+        )
+        self.rule_methods[_KosmoContextRules.aasd_002.value] = (
+            Referable,
+            "check_constraint_aasd_002",
+            kosmo_id_short_naming_rule,
+        )
 
     def _patch_kosmo_concept_description_rules(self):
         from aas_test_engines.test_cases.v3_0.model import (
@@ -158,13 +120,6 @@ class KosmoValidationContext(ExtendsValidationContext):
             DataSpecificationIec61360,
         )
 
-        original_check_aasc_3a_008 = ConceptDescription.check_aasc_3a_008
-        self.original_methods[_KosmoContextRules.aasc_3a_008.value] = (
-            ConceptDescription,
-            "check_aasc_3a_008",
-            original_check_aasc_3a_008,
-        )
-
         def kosmo_definition_rule(instance) -> Optional[str]:
             if instance.embedded_data_specifications is None:
                 return
@@ -177,4 +132,8 @@ class KosmoValidationContext(ExtendsValidationContext):
                     if ds.data_specification_content.definition is None:
                         return f"""The ConceptDescription "{instance.id_short}" violates the Kosmo rules:\n\r- description/definition이 누락되었습니다."""
 
-        ConceptDescription.check_aasc_3a_008 = kosmo_definition_rule
+        self.rule_methods[_KosmoContextRules.aasc_3a_008.value] = (
+            ConceptDescription,
+            "check_aasc_3a_008",
+            kosmo_definition_rule,
+        )
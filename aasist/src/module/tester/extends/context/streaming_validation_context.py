@@ -0,0 +1,96 @@
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
+
+from aasist.src.gui.handler import _TEST_LOG_NAME, LogLevel, QueueHandler
+from aasist.src.module.tester.constants import CHECKLIST
+from aasist.src.module.tester.extends.context.extends_validation_context import (
+    ExtendsValidationContext,
+)
+from aasist.src.module.tester.extends.registry.rule_plan import constraint_message
+from aas_test_engines.reflect import TypeBase
+from aas_test_engines.test_cases.v3_0.parse import CheckConstraintException
+
+# 검사: 모델 검사 메서드 이름 또는 construct -> 위반 메시지 함수
+StreamingCheck = Union[str, Callable[[TypeBase], Optional[str]]]
+StreamingRule = Tuple[str, Type[TypeBase], StreamingCheck]  # (규칙, 대상 클래스, 검사)
+
+
+class StreamingValidationContext(ExtendsValidationContext):
+    """
+    스트리밍 모드: 객체 하나만 보는 규칙을 파싱 후크에서 construct가 만들어질 때마다 평가
+    - 저장소에 모으지 않고 위반을 바로 로그로 보냄 (큰 파일도 파싱 중에 첫 위반이 보임)
+    - 규칙이 바뀔 때마다 위반 앞에 규칙 제목(CHECKLIST)을 붙여 보고서가 규칙별로 분류
+    - 파싱이 끝나면 위반이 없던 규칙의 제목도 남김 (기본 모드와 같은 규칙 제목 목록)
+    """
+
+    def __init__(self, rules: List[StreamingRule]):
+        super().__init__()
+        # 검사 메서드 이름이 틀리면 규칙이 조용히 통과하므로 바로 실패
+        for rule, target, check in rules:
+            if isinstance(check, str) and not hasattr(target, check):
+                raise AttributeError(
+                    f"{rule}: {target.__name__} has no check method '{check}'"
+                )
+        self.rules = rules
+        self.log_handler = QueueHandler(_TEST_LOG_NAME)
+        # 클래스별 (규칙, 검사 함수) 목록
+        self._dispatch: Dict[type, List[Tuple[str, Callable[[Any], Any]]]] = {}
+
+    def reset(self):
+        self.results: Dict[str, bool] = {rule: True for rule, _, _ in self.rules}
+        self._last_rule: Optional[str] = None
+        self._titled: Set[str] = set()
+
+    def collect(self, construct: TypeBase):
+        construct_class = construct.__class__
+        checks = self._dispatch.get(construct_class, None)
+        if checks is None:
+            checks = self._dispatch[construct_class] = self._classify(construct_class)
+
+        for rule, check in checks:
+            try:
+                message = check(construct)
+            except CheckConstraintException as e:
+                message = constraint_message(construct, e)
+            except TypeError:
+                continue
+            if not message:
+                continue
+            self.results[rule] = False
+            if rule != self._last_rule:
+                self._add_title(rule)
+            self.log_handler.add(message, LogLevel.ERROR)
+
+    def log_passed_titles(self):
+        """
+        파싱 후 호출: 위반 로그를 한 번도 보내지 않은 규칙의 제목을 선택 순서대로 추가
+        """
+        for rule, _, _ in self.rules:
+            if rule not in self._titled:
+                self._add_title(rule)
+
+    def _add_title(self, rule: str):
+        self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
+        self._last_rule = rule
+        self._titled.add(rule)
+
+    def interrupted(self) -> bool:
+        """
+        마지막 확인 이후 위반 로그를 보냈는지 (이어지는 로그 앞에 원래 제목을 다시 붙여야 함)
+        """
+        interrupted, self._last_rule = self._last_rule is not None, None
+        return interrupted
+
+    def _classify(
+        self, construct_class: Type[TypeBase]
+    ) -> List[Tuple[str, Callable[[Any], Any]]]:
+        checks = []
+        for rule, target, check in self.rules:
+            if not issubclass(construct_class, target):
+                continue
+            if isinstance(check, str):
+                # 하위 클래스가 None으로 비활성화한 검사는 제외
+                check = getattr(construct_class, check)
+                if check is None:
+                    continue
+            checks.append((rule, check))
+        return checks
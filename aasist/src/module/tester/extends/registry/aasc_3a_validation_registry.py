@@ -14,7 +14,10 @@ class Aasc3aValidationRegistry(ValidationRegistry):
         self.context = context
         self.results: dict[str, bool] = {}
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_002.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_002.name,
+        reads={"constraints_store": ["DataSpecificationIec61360"]},
+    )
     async def _aasc_3a_002(self, rule: str = IDTA.aasc_3a_002.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -23,7 +26,10 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_009.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_009.name,
+        reads={"constraints_store": ["DataSpecificationIec61360"]},
+    )
     async def _aasc_3a_009(self, rule: str = IDTA.aasc_3a_009.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -32,7 +38,10 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_010.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_010.name,
+        reads={"constraints_store": ["DataSpecificationIec61360"]},
+    )
     async def _aasc_3a_010(self, rule: str = IDTA.aasc_3a_010.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -41,7 +50,9 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_004.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_004.name, reads={"constraints_store": ["ConceptDescription"]}
+    )
     async def _aasc_3a_004(self, rule: str = IDTA.aasc_3a_004.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -50,7 +61,9 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_005.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_005.name, reads={"constraints_store": ["ConceptDescription"]}
+    )
     async def _aasc_3a_005(self, rule: str = IDTA.aasc_3a_005.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -59,7 +72,9 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_006.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_006.name, reads={"constraints_store": ["ConceptDescription"]}
+    )
     async def _aasc_3a_006(self, rule: str = IDTA.aasc_3a_006.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -68,7 +83,9 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_007.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_007.name, reads={"constraints_store": ["ConceptDescription"]}
+    )
     async def _aasc_3a_007(self, rule: str = IDTA.aasc_3a_007.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -77,7 +94,9 @@ class Aasc3aValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasc_3a_008.name)
+    @ValidationRegistry.validator(
+        IDTA.aasc_3a_008.name, reads={"constraints_store": ["ConceptDescription"]}
+    )
     async def _aasc_3a_008(self, rule: str = IDTA.aasc_3a_008.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
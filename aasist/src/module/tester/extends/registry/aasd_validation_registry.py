@@ -6,6 +6,13 @@ from aasist.src.module.tester.extends.context.aasd_validation_context import (
 from aasist.src.module.tester.extends.registry.validation_registry import (
     ValidationRegistry,
 )
+from aas_test_engines.test_cases.v3_0.model import (
+    AdministrativeInformation,
+    Entity,
+    Property,
+    Qualifier,
+    Referable,
+)
 
 
 class AasdValidationRegistry(ValidationRegistry):
@@ -14,16 +21,24 @@ class AasdValidationRegistry(ValidationRegistry):
         self.context = context
         self.results = {}
 
-    @ValidationRegistry.validator(IDTA.aasd_002.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_002.name,
+        reads={"parents_store": ["Referable"]},
+        streaming=(Referable, "check_constraint_aasd_002"),
+    )
     async def _aasd_002(self, rule: str = IDTA.aasd_002.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
             self.context.parents_store.get("Referable", []),
-            "check_constraints_aasd_002",
+            "check_constraint_aasd_002",
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_005.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_005.name,
+        reads={"constraints_store": ["AdministrativeInformation"]},
+        streaming=(AdministrativeInformation, "check_constraint_aasd_005"),
+    )
     async def _aasd_005(self, rule: str = IDTA.aasd_005.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -32,7 +47,11 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_006.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_006.name,
+        reads={"constraints_store": ["Qualifier"]},
+        streaming=(Qualifier, "check_aasd_006"),
+    )
     async def _aasd_006(self, rule: str = IDTA.aasd_006.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -41,7 +60,11 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_007.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_007.name,
+        reads={"constraints_store": ["Property"]},
+        streaming=(Property, "check_aasd_007"),
+    )
     async def _aasd_007(self, rule: str = IDTA.aasd_007.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -50,7 +73,11 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_014.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_014.name,
+        reads={"constraints_store": ["Entity"]},
+        streaming=(Entity, "check_aasd_014"),
+    )
     async def _aasd_014(self, rule: str = IDTA.aasd_014.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -59,7 +86,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_020.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_020.name, reads={"constraints_store": ["Qualifier"]}
+    )
     async def _aasd_020(self, rule: str = IDTA.aasd_020.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -68,7 +97,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_090.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_090.name, reads={"parents_store": ["DataElement"]}
+    )
     async def _aasd_090(self, rule: str = IDTA.aasd_090.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -77,7 +108,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_107.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_107.name, reads={"constraints_store": ["SubmodelElementList"]}
+    )
     async def _aasd_107(self, rule: str = IDTA.aasd_107.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -86,7 +119,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_109.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_109.name, reads={"constraints_store": ["SubmodelElementList"]}
+    )
     async def _aasd_109(self, rule: str = IDTA.aasd_109.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -95,7 +130,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_114.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_114.name, reads={"constraints_store": ["SubmodelElementList"]}
+    )
     async def _aasd_114(self, rule: str = IDTA.aasd_114.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -104,7 +141,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_116.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_116.name, reads={"constraints_store": ["AssetInformation"]}
+    )
     async def _aasd_116(self, rule: str = IDTA.aasd_116.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -113,7 +152,17 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_117.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_117.name,
+        reads={
+            "parents_store": ["AnnotatedRelationshipElement"],
+            "constraints_store": [
+                "OperationVariable",
+                "SubmodelElementCollection",
+                "Submodel",
+            ],
+        },
+    )
     async def _aasd_117(self, rule: str = IDTA.aasd_117.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -137,7 +186,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_118.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_118.name, reads={"parents_store": ["HasSemantics"]}
+    )
     async def _aasd_118(self, rule: str = IDTA.aasd_118.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -146,7 +197,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_119.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_119.name, reads={"constraints_store": ["Submodel"]}
+    )
     async def _aasd_119(self, rule: str = IDTA.aasd_119.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -155,7 +208,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_120.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_120.name, reads={"constraints_store": ["SubmodelElementList"]}
+    )
     async def _aasd_120(self, rule: str = IDTA.aasd_120.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -164,7 +219,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_121.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_121.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_121(self, rule: str = IDTA.aasd_121.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -173,7 +230,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_122.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_122.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_122(self, rule: str = IDTA.aasd_122.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -182,7 +241,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_123.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_123.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_123(self, rule: str = IDTA.aasd_123.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -191,7 +252,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_124.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_124.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_124(self, rule: str = IDTA.aasd_124.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -200,7 +263,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_125.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_125.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_125(self, rule: str = IDTA.aasd_125.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -209,7 +274,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_126.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_126.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_126(self, rule: str = IDTA.aasd_126.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -218,7 +285,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_127.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_127.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_127(self, rule: str = IDTA.aasd_127.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -227,7 +296,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_128.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_128.name, reads={"constraints_store": ["Reference"]}
+    )
     async def _aasd_128(self, rule: str = IDTA.aasd_128.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -236,7 +307,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_129.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_129.name, reads={"constraints_store": ["Submodel"]}
+    )
     async def _aasd_129(self, rule: str = IDTA.aasd_129.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -245,7 +318,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_130.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_130.name, reads={"constraints_store": ["StringFormattedValue"]}
+    )
     async def _aasd_130(self, rule: str = IDTA.aasd_130.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -254,7 +329,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_131.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_131.name, reads={"constraints_store": ["AssetInformation"]}
+    )
     async def _aasd_131(self, rule: str = IDTA.aasd_131.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -263,7 +340,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_133.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_133.name, reads={"constraints_store": ["SpecificAssetId"]}
+    )
     async def _aasd_133(self, rule: str = IDTA.aasd_133.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -272,7 +351,9 @@ class AasdValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(IDTA.aasd_134.name)
+    @ValidationRegistry.validator(
+        IDTA.aasd_134.name, reads={"constraints_store": ["Operation"]}
+    )
     async def _aasd_134(self, rule: str = IDTA.aasd_134.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -1,6 +1,8 @@
 import re
-from typing import List, Union
+from typing import List, Optional, Union
 from aasist.src.gui.handler import LogLevel
+from aasist.src.module.tester.executor import run_blocking
+from aasist.src.module.tester.extends.context.construct_record import ConstructRecord
 from aasist.src.module.tester.extends.context.kosmo_validation_context import (
     KosmoValidationContext,
 )
@@ -9,6 +11,31 @@ from aasist.src.module.tester.extends.registry.validation_registry import (
 )
 from aasist.src.module.tester.constants import EXTENSION_IRI, IRDI, KOSMO, CHECKLIST
 from aas_test_engines.reflect import TypeBase
+from aas_test_engines.test_cases.v3_0.model import (
+    AssetAdministrationShell,
+    ConceptDescription,
+    Submodel,
+)
+
+
+def _id_violation(record: ConstructRecord) -> Optional[str]:
+    """
+    IRDI/IRI(확장 IRI 포함) 형식이 아닌 Id의 위반 메시지
+    """
+    from aas_test_engines.data_types import is_any_uri
+
+    id = record.id
+    if id is None:
+        return None
+    if re.compile(IRDI).match(id):
+        return None
+    if is_any_uri(id) or re.compile(EXTENSION_IRI).match(id):
+        return None
+    return f"""The Id "{id}" violates the Kosmo rules: {record.class_name}의 ID {id}가 IRI 형식을 준수하지 않습니다.\n\r- 형식이 올바른 경우, 잘못된 공백이 포함되어 있을 수도 있습니다."""
+
+
+def _construct_id_violation(construct: TypeBase) -> Optional[str]:
+    return _id_violation(ConstructRecord.of(construct))
 
 
 class KosmoValidationRegistry(ValidationRegistry):
@@ -21,41 +48,42 @@ class KosmoValidationRegistry(ValidationRegistry):
         return ValidationRegistry.get_validator(name)
 
     # id 규칙
-    async def _id_rule(self, rule: str, constructs: List[TypeBase]):
-        from aas_test_engines.data_types import is_any_uri
-
+    async def _id_rule(self, rule: str, records: List[ConstructRecord]):
         self.results[rule] = True
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
-        for construct in constructs:
-            if not hasattr(construct, "id"):
-                continue
-            id = getattr(construct, "id")
-            if not hasattr(id, "raw_value"):
-                continue
-            is_irdi = re.compile(IRDI).match(id.raw_value)
-            if is_irdi:
-                continue
-            is_iri = is_any_uri(id.raw_value)
-            if not is_iri:
-                if re.compile(EXTENSION_IRI).match(id.raw_value):
-                    continue
-                self.log_handler.add(
-                    f"""The Id "{construct.id}" violates the Kosmo rules: {construct.__class__.__name__}의 ID {id.raw_value}가 IRI 형식을 준수하지 않습니다.\n\r- 형식이 올바른 경우, 잘못된 공백이 포함되어 있을 수도 있습니다.""",
-                    LogLevel.ERROR,
-                )
+        # 식별자마다 정규식/URI 검사 (CPU 작업은 executor에서 실행)
+        await run_blocking(self._check_ids, rule, records)
+
+    def _check_ids(self, rule: str, records: List[ConstructRecord]):
+        for record in records:
+            message = _id_violation(record)
+            if message:
+                self.log_handler.add(message, LogLevel.ERROR)
                 self.results[rule] = False
 
-    @ValidationRegistry.validator(KOSMO.aas_id.name)
+    @ValidationRegistry.validator(
+        KOSMO.aas_id.name,
+        reads={"identifiables": ["AssetAdministrationShell"]},
+        streaming=(AssetAdministrationShell, _construct_id_violation),
+    )
     async def _aas_id_rule(self, rule: str = KOSMO.aas_id.name):
         await self._id_rule(
             rule, self.context.identifiables["AssetAdministrationShell"]
         )
 
-    @ValidationRegistry.validator(KOSMO.submodel_id.name)
+    @ValidationRegistry.validator(
+        KOSMO.submodel_id.name,
+        reads={"identifiables": ["Submodel"]},
+        streaming=(Submodel, _construct_id_violation),
+    )
     async def _submodel_id_rule(self, rule: str = KOSMO.submodel_id.name):
         await self._id_rule(rule, self.context.identifiables["Submodel"])
 
-    @ValidationRegistry.validator(KOSMO.cd_id.name)
+    @ValidationRegistry.validator(
+        KOSMO.cd_id.name,
+        reads={"identifiables": ["ConceptDescription"]},
+        streaming=(ConceptDescription, _construct_id_violation),
+    )
     async def _smc_id_rule(self, rule: str = KOSMO.cd_id.name):
         await self._id_rule(rule, self.context.identifiables["ConceptDescription"])
 
@@ -67,31 +95,43 @@ class KosmoValidationRegistry(ValidationRegistry):
             constructs, "check_constraint_aasd_002", rule
         )
 
-    @ValidationRegistry.validator(KOSMO.aas_id_short.name)
+    @ValidationRegistry.validator(
+        KOSMO.aas_id_short.name, reads={"referables": ["AssetAdministrationShell"]}
+    )
     async def _aas_id_short_rule(self, rule: str = KOSMO.aas_id_short.name):
         await self._id_short_rule(
             rule, self.context.referables["AssetAdministrationShell"]
         )
 
-    @ValidationRegistry.validator(KOSMO.submodel_id_short.name)
+    @ValidationRegistry.validator(
+        KOSMO.submodel_id_short.name, reads={"referables": ["Submodel"]}
+    )
     async def _submodel_id_short_rule(self, rule: str = KOSMO.submodel_id_short.name):
         await self._id_short_rule(rule, self.context.referables["Submodel"])
 
-    @ValidationRegistry.validator(KOSMO.smc_id_short.name)
+    @ValidationRegistry.validator(
+        KOSMO.smc_id_short.name, reads={"referables": ["SubmodelElementCollection"]}
+    )
     async def _smc_id_short_rule(self, rule: str = KOSMO.smc_id_short.name):
         await self._id_short_rule(
             rule, self.context.referables["SubmodelElementCollection"]
         )
 
-    @ValidationRegistry.validator(KOSMO.prop_id_short.name)
+    @ValidationRegistry.validator(
+        KOSMO.prop_id_short.name, reads={"referables": ["Property"]}
+    )
     async def _prop_id_short_rule(self, rule: str = KOSMO.prop_id_short.name):
         await self._id_short_rule(rule, self.context.referables["Property"])
 
-    @ValidationRegistry.validator(KOSMO.cd_id_short.name)
+    @ValidationRegistry.validator(
+        KOSMO.cd_id_short.name, reads={"referables": ["ConceptDescription"]}
+    )
     async def _cd_id_short_rule(self, rule: str = KOSMO.cd_id_short.name):
         await self._id_short_rule(rule, self.context.referables["ConceptDescription"])
 
-    @ValidationRegistry.validator(KOSMO.aas_submodel.name)
+    @ValidationRegistry.validator(
+        KOSMO.aas_submodel.name, reads={"submodel_records": []}
+    )
     async def _submodel_component_rule(self, rule: str = KOSMO.aas_submodel.name):
         require_components = [
             "Identification",
@@ -100,20 +140,21 @@ class KosmoValidationRegistry(ValidationRegistry):
             "OperationalData",
         ]
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
-        id_shorts = [
-            ref.id_short.raw_value for ref in self.context.referables["Submodel"]
-        ]
+        id_shorts = [record.id_short for record in self.context.submodel_records]
         all_included = set(require_components).issubset(set(id_shorts))
         self.results[rule] = all_included
         if not all_included:
-            missing = set(require_components) - set(id_shorts)
+            # 프로세스마다 set 순서가 달라지지 않도록 선언 순서 유지
+            missing = [c for c in require_components if c not in id_shorts]
             self.log_handler.add(
                 f"""The Submodel violates the Kosmo rules:\n\r- 필수 서브모델 {', '.join(missing)}이(가) 누락되었습니다.""",
                 LogLevel.ERROR,
             )
             self.results[rule] = False
 
-    @ValidationRegistry.validator(KOSMO.aas_global_asset_id.name)
+    @ValidationRegistry.validator(
+        KOSMO.aas_global_asset_id.name, reads={"asset_informations": []}
+    )
     async def _global_asset_id_rule(self, rule: str = KOSMO.aas_global_asset_id.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
@@ -122,42 +163,48 @@ class KosmoValidationRegistry(ValidationRegistry):
             rule,
         )
 
-    @ValidationRegistry.validator(KOSMO.aas_type.name)
+    @ValidationRegistry.validator(KOSMO.aas_type.name, reads={"asset_records": []})
     async def _type_rule(self, rule: str = KOSMO.aas_type.name):
         from aas_test_engines.test_cases.v3_0.model import AssetKind
 
         self.results[rule] = True
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
-        for info in self.context.asset_informations:
-            if not hasattr(info, "asset_kind"):
+        for record in self.context.asset_records:
+            if record.asset_kind is None:
                 continue
-            if info.asset_kind != AssetKind.TYPE:
+            if record.asset_kind != AssetKind.TYPE:
                 self.log_handler.add(
-                    f"""The Kind "{info.asset_kind.value}" violates the Kosmo rules: Kind가 Type으로 지정되어야 합니다.""",
+                    f"""The Kind "{record.asset_kind.value}" violates the Kosmo rules: Kind가 Type으로 지정되어야 합니다.""",
                     LogLevel.ERROR,
                 )
                 self.results[rule] = False
 
-    @ValidationRegistry.validator(KOSMO.submodel_semantic_id.name)
+    @ValidationRegistry.validator(
+        KOSMO.submodel_semantic_id.name, reads={"referables": ["Submodel"]}
+    )
     async def _semantic_id_rule(self, rule: str = KOSMO.submodel_semantic_id.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
             self.context.referables["Submodel"], "check_aasd_118", rule
         )
 
-    @ValidationRegistry.validator(KOSMO.submodel_kind.name)
+    @ValidationRegistry.validator(
+        KOSMO.submodel_kind.name, reads={"referables": ["Submodel"]}
+    )
     async def _kind_rule(self, rule: str = KOSMO.submodel_kind.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
             self.context.referables["Submodel"], "check_aasd_129", rule
         )
 
-    @ValidationRegistry.validator(KOSMO.prop_value.name)
+    @ValidationRegistry.validator(KOSMO.prop_value.name, reads={})
     async def _value_rule(self, rule: str = KOSMO.prop_value.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         # TODO
 
-    @ValidationRegistry.validator(KOSMO.cd_definition.name)
+    @ValidationRegistry.validator(
+        KOSMO.cd_definition.name, reads={"referables": ["ConceptDescription"]}
+    )
     async def _definition_rule(self, rule: str = KOSMO.cd_definition.name):
         self.log_handler.add(f"{CHECKLIST[rule]}", LogLevel.INFO)
         await self.check_rule_with_logging(
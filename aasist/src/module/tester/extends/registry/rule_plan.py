@@ -0,0 +1,130 @@
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from aasist.src.gui.handler import LogLevel, QueueHandler
+from aas_test_engines.reflect import TypeBase
+from aas_test_engines.test_cases.v3_0.parse import CheckConstraintException
+
+
+class RuleCheck:
+    """
+    규칙 하나가 저장소 하나에 대해 호출할 검사 메서드
+    messages: 저장소 순서대로 모은 위반 메시지
+    """
+
+    def __init__(self, objects: List[TypeBase], method_name: str, rule: Enum):
+        self.objects = objects
+        self.method_name = method_name
+        self.rule = rule
+        self.messages: List[str] = []
+
+
+_Entry = Union[Tuple[str, LogLevel], RuleCheck]
+
+# 지금 계획 중인 규칙의 로그 구간 (asyncio.gather로 함께 계획해도 규칙별로 분리)
+_rule_log: ContextVar[List[_Entry]] = ContextVar("_rule_log")
+
+
+class _PlannedLog:
+    """
+    계획 단계의 로그 핸들러: 일반 로그를 현재 규칙의 로그 구간에 기록
+    """
+
+    def add(self, log: str, log_level: LogLevel = LogLevel.TRACE):
+        _rule_log.get().append((log, log_level))
+
+
+class RulePlan:
+    """
+    규칙별 저장소 순회를 객체 단위 순회로 바꿔 평가
+    - 저장소의 객체를 한 번만 방문해 그 저장소를 쓰는 모든 규칙의 검사를 호출
+    - 검사 메서드는 저장소 안에서 클래스마다 한 번만 찾음
+    - 로그는 규칙 순서, 저장소 순서 그대로 출력
+    """
+
+    def __init__(self):
+        self.log = _PlannedLog()
+        self._segments: List[List[_Entry]] = []
+        self._checks: List[RuleCheck] = []
+
+    def segment(self) -> List[_Entry]:
+        """
+        규칙 하나의 로그 구간 (출력 순서를 위해 규칙 순서대로 미리 만듦)
+        """
+        segment: List[_Entry] = []
+        self._segments.append(segment)
+        return segment
+
+    @staticmethod
+    def enter(segment: List[_Entry]):
+        """
+        현재 작업(task)의 로그 구간 지정
+        """
+        _rule_log.set(segment)
+
+    def add(self, objects: List[TypeBase], method_name: str, rule: Enum):
+        check = RuleCheck(objects, method_name, rule)
+        self._checks.append(check)
+        _rule_log.get().append(check)
+
+    def run(self, results: Dict[str, bool]):
+        # 같은 저장소(list)를 쓰는 검사끼리 묶어 저장소마다 한 번만 순회
+        stores: Dict[int, Tuple[List[TypeBase], List[RuleCheck]]] = {}
+        for check in self._checks:
+            stores.setdefault(id(check.objects), (check.objects, []))[1].append(check)
+
+        for objects, checks in stores.values():
+            # 클래스별로 호출할 (검사, 메서드) 목록 (hasattr/getattr 반복 없음)
+            dispatch: Dict[type, List[Tuple[RuleCheck, Callable[[Any], Any]]]] = {}
+            for obj in objects:
+                obj_class = obj.__class__
+                methods = dispatch.get(obj_class, None)
+                if methods is None:
+                    methods = dispatch[obj_class] = [
+                        (check, method)
+                        for check in checks
+                        if (method := getattr(obj_class, check.method_name, None))
+                        is not None
+                    ]
+                for check, method in methods:
+                    try:
+                        message = method(obj)
+                    except CheckConstraintException as e:
+                        message = constraint_message(obj, e)
+                    except TypeError:
+                        continue
+                    if message:
+                        check.messages.append(message)
+                        results[check.rule] = False
+
+    def replay(self, log_handler: QueueHandler):
+        for segment in self._segments:
+            for entry in segment:
+                if isinstance(entry, RuleCheck):
+                    for message in entry.messages:
+                        log_handler.add(message, log_level=LogLevel.ERROR)
+                else:
+                    log_handler.add(*entry)
+
+
+def constraint_message(obj: TypeBase, e: CheckConstraintException) -> str:
+    """
+    CheckConstraintException을 객체 이름(idShort 또는 참조 키)과 함께 메시지로 변환
+    """
+    id = getattr(obj, "id_short", None)
+    keys = getattr(obj, "keys", None)
+    if not id and keys:
+        values = [
+            key.value.raw_value
+            for key in keys
+            if getattr(key, "value", None)
+            and getattr(key.value, "raw_value", None) is not None
+        ]
+        if values:
+            id = ", ".join(values)
+    return (
+        f'- {obj.__class__.__name__} "{id}"" is {e}'
+        if id
+        else f"- {obj.__class__.__name__} is {e}"
+    )
@@ -1,15 +1,31 @@
 from functools import wraps
-from typing import Callable, Dict, Iterable
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+# 컨텍스트 저장소 이름 -> 읽는 키(클래스 이름) 집합 (목록 저장소는 빈 집합)
+StoreReads = Dict[str, Set[str]]
 
 
 class Validation:
 
     def __init__(self):
         self._validators: Dict[str, Callable] = {}
-
-    def register(self, *validators: Iterable[str]):
+        self._reads: Dict[str, StoreReads] = {}
+        self._streaming: Dict[str, Tuple[type, Any]] = {}
+
+    def register(
+        self,
+        *validators: Iterable[str],
+        reads: Dict[str, Iterable[str]] = None,
+        streaming: Tuple[type, Any] = None,
+    ):
         def decorator(func):
             for name in validators:
+                if reads is not None:
+                    self._reads[name] = {
+                        store: set(keys) for store, keys in reads.items()
+                    }
+                if streaming is not None:
+                    self._streaming[name] = streaming
 
                 @wraps(func)
                 async def wrapper(*args, rule=name, **kwargs):
@@ -22,3 +38,15 @@ class Validation:
 
     def get_validator(self, validator: str) -> Callable:
         return self._validators.get(validator)
+
+    def get_reads(self, validator: str) -> Optional[StoreReads]:
+        """
+        규칙이 읽는 저장소/키 (선언이 없으면 None: 모든 저장소를 읽는 것으로 간주)
+        """
+        return self._reads.get(validator)
+
+    def get_streaming(self, validator: str) -> Tuple[type, Any]:
+        """
+        (대상 클래스, 검사): 파싱 중에 객체 하나씩 평가할 수 있는 규칙 (없으면 None)
+        """
+        return self._streaming.get(validator)
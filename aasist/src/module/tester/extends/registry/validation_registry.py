@@ -1,8 +1,20 @@
 import asyncio
 from enum import Enum
-from typing import Iterable, List, Union
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
 from aasist.src.gui.handler import _TEST_LOG_NAME, LogLevel, QueueHandler
-from aasist.src.module.tester.extends.registry.validation import Validation
+from aasist.src.module.tester.executor import run_blocking
+from aasist.src.module.tester.extends.context.streaming_validation_context import (
+    StreamingCheck,
+    StreamingRule,
+)
+from aasist.src.module.tester.extends.registry.rule_plan import (
+    RulePlan,
+    constraint_message,
+)
+from aasist.src.module.tester.extends.registry.validation import (
+    StoreReads,
+    Validation,
+)
 from aas_test_engines.reflect import TypeBase
 from aas_test_engines.test_cases.v3_0.parse import CheckConstraintException
 
@@ -11,53 +23,102 @@ class ValidationRegistry:
     _registry = Validation()
     results: dict[str, bool] = {}
     log_handler = QueueHandler(_TEST_LOG_NAME)
+    _plan: RulePlan = None
 
     @classmethod
     def get_validator(cls, name: str):
         return cls._registry.get_validator(name)
 
     @classmethod
-    def validator(cls, *validators: Iterable[str]):
-        return cls._registry.register(*validators)
+    def validator(
+        cls,
+        *validators: Iterable[str],
+        reads: Dict[str, Iterable[str]] = None,
+        streaming: Tuple[type, StreamingCheck] = None,
+    ):
+        """
+        reads: {컨텍스트 저장소 이름: 읽는 키} 컨텍스트는 선택된 규칙이 읽는 저장소/키만 수집
+        streaming: (대상 클래스, 검사 메서드 이름 또는 함수) 객체 하나만 보는 규칙 (스트리밍 모드에서 파싱 중 평가)
+        """
+        return cls._registry.register(*validators, reads=reads, streaming=streaming)
+
+    @classmethod
+    def streaming_rules(cls, options: Dict[str, bool]) -> List[StreamingRule]:
+        rules = []
+        for option, enabled in options.items():
+            streaming = cls._registry.get_streaming(option) if enabled else None
+            if streaming is not None:
+                rules.append((option, *streaming))
+        return rules
+
+    @classmethod
+    def reads(cls, options: Dict[str, bool]) -> Optional[StoreReads]:
+        """
+        선택된 규칙이 읽는 저장소/키의 합집합 (선언 없는 규칙이 있으면 None: 전부 수집)
+        """
+        union: StoreReads = {}
+        for option, enabled in options.items():
+            if not enabled or cls._registry.get_validator(option) is None:
+                continue
+            reads = cls._registry.get_reads(option)
+            if reads is None:
+                return None
+            for store, keys in reads.items():
+                union.setdefault(store, set()).update(keys)
+        return union
+
+    async def evaluate(self, options: Dict[str, bool]):
+        """
+        선택된 규칙의 검사 대상을 먼저 모은 뒤(RulePlan) 객체 단위로 한 번에 평가
+        규칙 계획은 asyncio.gather로 함께 실행하고, 객체 순회(CPU 작업)는 executor에서 실행
+        """
+        plan = RulePlan()
+        log_handler = self.log_handler
+        self._plan, self.log_handler = plan, plan.log
+        try:
+            await asyncio.gather(
+                *(
+                    self._plan_rule(plan.segment(), validator)
+                    for validator in self._validators(options)
+                )
+            )
+        finally:
+            self._plan, self.log_handler = None, log_handler
+
+        await run_blocking(plan.run, self.results)
+        plan.replay(log_handler)
+
+    def _validators(self, options: Dict[str, bool]) -> List[Callable]:
+        validators = [
+            self.get_validator(option) for option, enabled in options.items() if enabled
+        ]
+        return [validator for validator in validators if validator]
+
+    async def _plan_rule(self, segment: list, validator: Callable):
+        RulePlan.enter(segment)
+        await validator(self)
 
     async def check_rule_with_logging(
         self, objects: List[TypeBase], method_name: Union[str, List[str]], rule: Enum
     ):
         self.results[rule] = self.results.get(rule, True)
+        if self._plan is not None:
+            self._plan.add(objects, method_name, rule)
+            return
         for obj in objects:
-            if hasattr(obj, method_name) is False:
+            method = getattr(obj.__class__, method_name, None)
+            if method is None:
                 continue
             try:
-                message = getattr(obj, method_name)()
-                if not message:
-                    continue
-                await asyncio.sleep(0.1)
-                self.log_handler.add(
-                    message,
-                    log_level=LogLevel.ERROR,
-                )
-                self.results[rule] = False
+                message = method(obj)
             except CheckConstraintException as e:
-                await asyncio.sleep(0.1)
-                id = getattr(obj, "id_short", None)
-                keys = getattr(obj, "keys", None)
-                if not id and keys:
-                    values = [
-                        key.value.raw_value
-                        for key in keys
-                        if getattr(key, "value", None)
-                        and getattr(key.value, "raw_value", None) is not None
-                    ]
-                    if values:
-                        id = ", ".join(values)
-                self.log_handler.add(
-                    (
-                        f'- {obj.__class__.__name__} "{id}"" is {e}'
-                        if id
-                        else f"- {obj.__class__.__name__} is {e}"
-                    ),
-                    log_level=LogLevel.ERROR,
-                )
-                self.results[rule] = False
-            except TypeError as e:
-                pass
+                message = constraint_message(obj, e)
+            except TypeError:
+                continue
+            if not message:
+                continue
+            self.log_handler.add(
+                message,
+                log_level=LogLevel.ERROR,
+            )
+            self.results[rule] = False
@@ -0,0 +1,164 @@
+from collections import defaultdict
+from concurrent.futures import Future, ProcessPoolExecutor
+import multiprocessing
+import os
+from queue import Empty
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from aasist.src.gui.handler import _TEST_LOG_NAME, LogLevel, QueueHandler
+from aasist.src.module.tester.file.file_verificator import TestFileVerficator
+
+# 워커 프로세스 전역 (initializer에서 설정)
+_worker_log_queue = None
+_worker_cancel_event = None
+
+
+class _FileLogQueue:
+    """
+    워커의 QueueHandler가 쓰는 큐: 로그에 파일 순번을 붙여 공유 큐로 전달
+    """
+
+    def __init__(self, log_queue, index: int):
+        self._log_queue = log_queue
+        self._index = index
+
+    def put(self, log: Tuple[str, LogLevel]):
+        self._log_queue.put((self._index, log))
+
+    def done(self):
+        self._log_queue.put((self._index, None))
+
+
+def _init_worker(log_queue, cancel_event):
+    global _worker_log_queue, _worker_cancel_event
+    _worker_log_queue = log_queue
+    _worker_cancel_event = cancel_event
+
+
+def _verify_file(
+    index: int,
+    file: str,
+    idta_options: Dict[str, bool],
+    kosmo_options: Dict[str, bool],
+    use_cache: bool = True,
+    streaming: bool = False,
+) -> Tuple[Dict[str, bool], float]:
+    file_log_queue = _FileLogQueue(_worker_log_queue, index)
+    started = time.perf_counter()
+    try:
+        if _worker_cancel_event.is_set():
+            return {}, 0.0
+        # 검증 후크는 문맥별이라 스레드로도 나눌 수 있지만, 파싱/규칙 평가가 CPU 작업(GIL)이므로 프로세스로 분리
+        verificator = TestFileVerficator(
+            file=file,
+            stop_event=_worker_cancel_event,
+            idta_options=idta_options,
+            kosmo_options=kosmo_options,
+            use_cache=use_cache,
+            streaming=streaming,
+        )
+        with QueueHandler(_TEST_LOG_NAME).redirect(file_log_queue):
+            verificator.verify()
+        return verificator.results, time.perf_counter() - started
+    finally:
+        file_log_queue.done()
+
+
+class BatchFileVerificator:
+    """
+    여러 파일을 프로세스 풀에서 검증, 로그는 파일 순서대로 _TEST_LOG_NAME 핸들러에 전달
+    """
+
+    POLL_INTERVAL = 0.1  # sec
+
+    def __init__(self, files: List[str], **kwargs):
+        self._files = files
+        self.idta_options: Dict[str, bool] = kwargs.get("idta_options", {})
+        self.kosmo_options: Dict[str, bool] = kwargs.get("kosmo_options", {})
+        self.workers: int = kwargs.get("workers") or os.cpu_count() or 1
+        self.use_cache: bool = kwargs.get("use_cache", True)
+        self.streaming: bool = kwargs.get("streaming", False)
+        self.results: Dict[str, Dict[str, bool]] = {}
+        self.logs: Dict[str, List[Tuple[str, LogLevel]]] = {}
+        self.timings: Dict[str, float] = {}
+        self.log_handler = QueueHandler(_TEST_LOG_NAME)
+        self.stop_event: threading.Event = kwargs.get("stop_event", None)
+
+    def verify(self) -> Dict[str, Dict[str, bool]]:
+        if not self._files:
+            return self.results
+
+        # spawn: GUI(Tk) 스레드가 있는 프로세스를 fork 하지 않음
+        context = multiprocessing.get_context("spawn")
+        log_queue = context.Queue()
+        cancel_event = context.Event()
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(self._files)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(log_queue, cancel_event),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _verify_file,
+                    i,
+                    file,
+                    self.idta_options,
+                    self.kosmo_options,
+                    self.use_cache,
+                    self.streaming,
+                )
+                for i, file in enumerate(self._files)
+            ]
+            self._pump_logs(log_queue, cancel_event, futures)
+
+            for file, future in zip(self._files, futures):
+                try:
+                    self.results[file], self.timings[file] = future.result()
+                except Exception as e:
+                    self.results[file], self.timings[file] = {}, 0.0
+                    self.log_handler.add(
+                        f"Error verifying file: {file} {e}", LogLevel.ERROR
+                    )
+
+        return self.results
+
+    def _pump_logs(self, log_queue, cancel_event, futures: List[Future]):
+        """
+        현재 파일의 로그는 바로 전달, 뒤 순번 파일의 로그는 차례가 올 때까지 보관
+        """
+        pending: Dict[int, List[Tuple[str, LogLevel]]] = defaultdict(list)
+        finished = set()
+        current = 0
+
+        while current < len(futures):
+            if self.stop_event and self.stop_event.is_set():
+                cancel_event.set()
+
+            item: Optional[Tuple[int, Any]] = None
+            try:
+                item = log_queue.get(timeout=self.POLL_INTERVAL)
+            except Empty:
+                # 워커가 비정상 종료되면 종료 표시가 오지 않음
+                future = futures[current]
+                if future.done() and future.exception() is not None:
+                    finished.add(current)
+
+            if item is not None:
+                index, log = item
+                if log is None:
+                    finished.add(index)
+                else:
+                    self.logs.setdefault(self._files[index], []).append(log)
+                    if index <= current:
+                        self.log_handler.add(*log)
+                    else:
+                        pending[index].append(log)
+
+            while current in finished:
+                current += 1
+                for log in pending.pop(current, []):
+                    self.log_handler.add(*log)
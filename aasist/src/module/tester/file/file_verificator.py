@@ -1,12 +1,17 @@
 from dataclasses import dataclass
 from enum import Enum
-from queue import Empty
+from queue import Queue
 import re
 import threading
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
 from aas_test_engines import file as te
 import asyncio
-from aasist.src.gui.handler import _TEST_LOG_NAME, LogLevel, QueueHandler
+from aasist.src.gui.handler import (
+    _RESULT_LOG_NAME,
+    _TEST_LOG_NAME,
+    LogLevel,
+    QueueHandler,
+)
 from aasist.src.module.format import AasFileFormat
 from aasist.src.module.tester.extends.context.aasc_3a_validation_context import (
     Aasc3aValidationContext,
@@ -16,6 +21,7 @@ from aasist.src.module.tester.extends.context.aasd_validation_context import (
 )
 from aasist.src.module.tester.extends.context.extends_validation_context import (
     ExtendsValidationContext,
+    SharedParseValidationContext,
 )
 from aasist.src.module.tester.extends.context.kosmo_validation_context import (
     KosmoValidationContext,
@@ -23,7 +29,15 @@ from aasist.src.module.tester.extends.context.kosmo_validation_context import (
 from aasist.src.module.tester.extends.context.lenient_validation_context import (
     LenientValidationContext,
 )
+from aasist.src.module.tester.extends.context.streaming_validation_context import (
+    StreamingValidationContext,
+)
 from aasist.src.module.tester.constants import IDTA, CHECKLIST
+from aasist.src.module.tester.executor import run_blocking
+from aasist.src.module.tester.file.result_cache import (
+    ValidationResultCache,
+    rules_fingerprint,
+)
 from aasist.src.module.tester.extends.registry.aasc_3a_validation_registry import (
     Aasc3aValidationRegistry,
 )
@@ -41,9 +55,31 @@ from aasist.src.module.tester.extends.registry.kosmo_validation_registry import
     KosmoValidationRegistry,
 )
 
+RESULT_LOG_HEADER = "=========== [Test result] ==========="
+
+
+class _RecordingLogQueue:
+    """
+    로그를 원래 큐로 전달하면서 캐시 저장용으로 기록
+    """
+
+    def __init__(self, log_queue):
+        self.log_queue = log_queue
+        self.logs: List[Tuple[str, LogLevel]] = []
+
+    def put(self, log: Tuple[str, LogLevel]):
+        self.logs.append(log)
+        self.log_queue.put(log)
+
+    def __getattr__(self, name: str):
+        # 읽기(get_nowait, empty 등)는 원래 큐 그대로 (GUI LogBox가 검증 중에도 drain)
+        return getattr(self.log_queue, name)
+
 
 class TestFileVerficator:
 
+    STOP_POLL_INTERVAL = 0.05  # sec
+
     def __init__(self, file: str, **kwargs):
         self._file = file
         self.idta_options: Dict[str, bool] = kwargs.get("idta_options", {})
@@ -51,11 +87,75 @@ class TestFileVerficator:
         self.results: Dict[str, bool] = {}
         self.log_handler = QueueHandler(_TEST_LOG_NAME)
         self.stop_event: threading.Event = kwargs.get("stop_event", None)
+        self.use_cache: bool = kwargs.get("use_cache", True)
+        # 객체 하나만 보는 규칙을 파싱 중에 평가 (위반 로그가 파싱 순서로 먼저 나옴)
+        self.streaming: bool = kwargs.get("streaming", False)
+        self._stream: Optional[StreamingValidationContext] = None
+        self._cache: ValidationResultCache = kwargs.get(
+            "cache", None
+        ) or ValidationResultCache()
 
     def verify(self):
         self.log_handler.add("=========== [Test start] ===========")
         self.log_handler.add(f"Testing file: {self._file}")
 
+        cache_key = self._cache_key()
+        cached = self._cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            # 같은 내용/옵션으로 검증한 적이 있으면 파싱 없이 로그와 결과를 재생
+            logs, self.results = cached
+            for message, level in logs:
+                self.log_handler.add(message, level)
+            return
+
+        # 이 검증(스레드)의 로그만 기록 (같은 프로세스의 다른 검증에는 영향 없음)
+        recorder = _RecordingLogQueue(self.log_handler.current_queue)
+        with self.log_handler.redirect(recorder):
+            self._verify()
+
+        stopped = self.stop_event is not None and self.stop_event.is_set()
+        if cache_key and not stopped:
+            self._cache.put(cache_key, recorder.logs, self.results)
+
+    def _cache_key(self) -> Optional[str]:
+        # 검증 코드를 식별할 수 없으면 오래된 결과를 재생하지 않도록 캐시를 쓰지 않음
+        if not self.use_cache or rules_fingerprint() is None:
+            return None
+        try:
+            return self._cache.key(
+                self._file, self.idta_options, self.kosmo_options, self.streaming
+            )
+        except OSError:
+            return None
+
+    def _verify(self):
+        # 검증 한 번에 이벤트 루프 하나 (규칙 평가, executor 작업, 중단 감시를 모두 이 루프에서 실행)
+        asyncio.run(self._run_until_stopped())
+
+    async def _run_until_stopped(self):
+        checks = asyncio.ensure_future(self._run_checks())
+        watcher = (
+            asyncio.ensure_future(self._watch_stop(checks))
+            if self.stop_event is not None
+            else None
+        )
+        try:
+            await checks
+        except asyncio.CancelledError:
+            if not (self.stop_event and self.stop_event.is_set()):
+                raise
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+
+    async def _watch_stop(self, checks: asyncio.Future):
+        # stop_event(threading.Event)는 await 할 수 없으므로 루프 안에서 확인 후 작업을 취소
+        while not self.stop_event.is_set():
+            await asyncio.sleep(self.STOP_POLL_INTERVAL)
+        self.log_handler.add("Test stopped!", LogLevel.INFO)
+        checks.cancel()
+
+    async def _run_checks(self):
         if self.idta_options:
             self.log_handler.add("AAS Checklist options: IDTA", LogLevel.INFO)
 
@@ -64,52 +164,101 @@ class TestFileVerficator:
             for k, v in self.idta_options.items()
             if k in [IDTA.standard.name, IDTA.optional.name]
         }
-
-        if standard_idta_options:
-            for idta_option, enabled in standard_idta_options.items():
-                if not enabled:
-                    continue
-                if self.stop_event and self.stop_event.is_set():
-                    return
-                self.log_handler.add(f"{CHECKLIST[idta_option]}", LogLevel.INFO)
-                if idta_option == IDTA.standard.name:
-                    self._check_with_detail_log(self._file, IDTA.standard)
-                if idta_option == IDTA.optional.name:
-                    with LenientValidationContext() as ctx:  # TODO: AASX 뷰어 조회되면 pass
-                        # self._check_with_detail_log(self._file, IDTA.optional)
-                        pass
-
         aasd_idta_constraints_options = {
             k: v for k, v in self.idta_options.items() if "aasd" in k
         }
+        aasc_3a_idta_constraints_options = {
+            k: v for k, v in self.idta_options.items() if "aasc_3a" in k
+        }
+
+        # 스트리밍 모드: 객체 하나만 보는 규칙은 파싱 중에 평가 (저장소 수집/레지스트리 평가에서 제외)
+        self._stream = (
+            StreamingValidationContext(
+                ValidationRegistry.streaming_rules(
+                    {
+                        **aasd_idta_constraints_options,
+                        **aasc_3a_idta_constraints_options,
+                        **self.kosmo_options,
+                    }
+                )
+            )
+            if self.streaming
+            else None
+        )
+        streamed = {rule for rule, _, _ in self._stream.rules} if self._stream else set()
+
+        def collected(options: Dict[str, bool]) -> Dict[str, bool]:
+            return {k: v for k, v in options.items() if k not in streamed}
+
+        # 컨텍스트는 선택된 규칙이 읽는 저장소/클래스만 수집
+        aasd_context = AasdValidationContext(
+            reads=AasdValidationRegistry.reads(collected(aasd_idta_constraints_options))
+        )
+        aasc_3a_context = Aasc3aValidationContext(
+            reads=Aasc3aValidationRegistry.reads(
+                collected(aasc_3a_idta_constraints_options)
+            )
+        )
+        kosmo_context = KosmoValidationContext(
+            reads=KosmoValidationRegistry.reads(collected(self.kosmo_options))
+        )
+        contexts = [
+            context
+            for options, context in [
+                (collected(aasd_idta_constraints_options), aasd_context),
+                (collected(aasc_3a_idta_constraints_options), aasc_3a_context),
+                (collected(self.kosmo_options), kosmo_context),
+            ]
+            if options
+        ]
+        if streamed:
+            contexts.append(self._stream)
 
+        # 파일은 한 번만 파싱: 표준 검사(또는 단순 파싱) 중에 모든 컨텍스트 저장소를 채움
+        with SharedParseValidationContext(*contexts):
+            parsed = False
+            if standard_idta_options:
+                for idta_option, enabled in standard_idta_options.items():
+                    if not enabled:
+                        continue
+                    self.log_handler.add(f"{CHECKLIST[idta_option]}", LogLevel.INFO)
+                    if idta_option == IDTA.standard.name:
+                        await self._check_with_detail_log(self._file, IDTA.standard)
+                        parsed = True
+                    if idta_option == IDTA.optional.name:
+                        with LenientValidationContext() as ctx:  # TODO: AASX 뷰어 조회되면 pass
+                            # self._check_with_detail_log(self._file, IDTA.optional)
+                            pass
+
+            if contexts and not parsed:
+                await self._check(self._file)
+                if self._stream is not None:
+                    self._stream.log_passed_titles()
+
+        # 레지스트리끼리는 차례로 평가 (로그 순서 유지)
         if aasd_idta_constraints_options:
-            self._execute_register(
+            await self._execute_register(
                 options=aasd_idta_constraints_options,
-                context=AasdValidationContext,
+                context=aasd_context,
                 registry=AasdValidationRegistry,
             )
 
-        aasc_3a_idta_constraints_options = {
-            k: v for k, v in self.idta_options.items() if "aasc_3a" in k
-        }
-
         if aasc_3a_idta_constraints_options:
-            self._execute_register(
+            await self._execute_register(
                 options=aasc_3a_idta_constraints_options,
-                context=Aasc3aValidationContext,
+                context=aasc_3a_context,
                 registry=Aasc3aValidationRegistry,
             )
 
         if self.kosmo_options:
             self.log_handler.add("AAS Checklist options: KOSMO", LogLevel.INFO)
-            self._execute_register(
+            await self._execute_register(
                 options=self.kosmo_options,
-                context=KosmoValidationContext,
+                context=kosmo_context,
                 registry=KosmoValidationRegistry,
             )
 
-        self.log_handler.add("=========== [Test result] ===========")
+        self.log_handler.add(RESULT_LOG_HEADER)
         for checklist, ok in self.results.items():
             if ok:
                 self.log_handler.add(
@@ -122,7 +271,7 @@ class TestFileVerficator:
                     LogLevel.ERROR,
                 )
 
-    def _execute_register(
+    async def _execute_register(
         self,
         options: Dict[str, bool],
         context: ExtendsValidationContext,
@@ -131,65 +280,69 @@ class TestFileVerficator:
         if not options:
             return
 
-        with context() as ctx:
+        streamed = self._stream.results if self._stream else {}
+
+        # 공유 파싱 결과로 평가, 규칙 재정의(KOSMO)는 이 구간에서만 적용
+        with context.rules() as ctx:
             registry: ValidationRegistry = registry(context=ctx)
-            self._check(self._file)
-            for option, enabled in options.items():
-                if not enabled:
-                    continue
-                if self.stop_event and self.stop_event.is_set():
-                    return
-                validator = registry.get_validator(option)
-                if not validator:
-                    continue
-                asyncio.run(validator(registry))
-
-            self.results.update(registry.results)
-
-    def _check_with_detail_log(self, file: str, checklist: Enum):
-        extension = re.sub(r".*\.", "", file)
-        result: AasTestResultWrapper = None
+            await registry.evaluate(
+                {k: v for k, v in options.items() if k not in streamed}
+            )
+
+            results = registry.results
+            if streamed:
+                # 파싱 중에 평가한 규칙의 결과를 선택 순서대로 합침
+                results = {
+                    option: streamed[option] if option in streamed else results[option]
+                    for option in options
+                    if option in streamed or option in results
+                }
+            self.results.update(results)
+
+    async def _check_with_detail_log(self, file: str, checklist: Enum):
+        # 결과 로그는 이 검증 전용 큐에 쌓음 (중단되거나 동시에 검증해도 다른 검증과 섞이지 않음)
+        with QueueHandler(_RESULT_LOG_NAME).redirect(Queue()):
+            try:
+                result = await run_blocking(self._check_file, file, True)
+            except FileNotFoundError:
+                self.log_handler.add(f"{file} not found.", LogLevel.ERROR)
+                return
+
+            if self._stream is not None:
+                self._stream.log_passed_titles()
+            if self._stream is not None and self._stream.interrupted():
+                # 파싱 중 스트리밍 로그가 끼어들었으면 검사 제목을 다시 붙임
+                self.log_handler.add(f"{CHECKLIST[checklist.name]}", LogLevel.INFO)
+            for message, level in result.logs.drain():
+                self.log_handler.add(message, level)
 
+        self.results[checklist.name] = result.ok()
+
+    async def _check(self, file: str):
         try:
-            with open(file, "rb") as f:
-                if extension == AasFileFormat.AASX.value:
-                    result = te.check_aasx_file(f)
-                if extension == AasFileFormat.XML.value:
-                    result = te.check_xml_file(f)
-                if extension == AasFileFormat.JSON.value:
-                    result = te.check_json_file(f)
-
-            result = wrap_test_result(result)
-
-            async def _input_log():
-                for _ in result.to_logs():
-                    await asyncio.sleep(0.1)
-                while True:
-                    try:
-                        if self.stop_event and self.stop_event.is_set():
-                            self.log_handler.add("Test stopped!", LogLevel.INFO)
-                            result.logs.clear()
-                            break
-                        message, level = result.logs.get()
-                        self.log_handler.add(message, level)
-                        await asyncio.sleep(0.1)
-                    except Empty:
-                        break
-
-            asyncio.run(_input_log())
-            self.results[checklist.name] = result.ok()
+            await run_blocking(self._check_file, file, False)
         except FileNotFoundError:
             self.log_handler.add(f"{file} not found.", LogLevel.ERROR)
 
-    def _check(self, file: str):
+    def _check_file(self, file: str, detail: bool) -> Optional[AasTestResultWrapper]:
+        """
+        파싱/표준 검사 (executor 스레드에서 실행)
+        detail: 하위 결과를 감싸 결과 로그 큐에 메시지를 쌓음
+        """
         extension = re.sub(r".*\.", "", file)
-        try:
-            with open(file, "rb") as f:
-                if extension == AasFileFormat.AASX.value:
-                    te.check_aasx_file(f)
-                if extension == AasFileFormat.XML.value:
-                    te.check_xml_file(f)
-                if extension == AasFileFormat.JSON.value:
-                    te.check_json_file(f)
-        except FileNotFoundError:
-            self.log_handler.add(f"{file} not found.", LogLevel.ERROR)
+        result = None
+        with open(file, "rb") as f:
+            if extension == AasFileFormat.AASX.value:
+                result = te.check_aasx_file(f)
+            if extension == AasFileFormat.XML.value:
+                result = te.check_xml_file(f)
+            if extension == AasFileFormat.JSON.value:
+                result = te.check_json_file(f)
+
+        if not detail:
+            return None
+
+        result: AasTestResultWrapper = wrap_test_result(result)
+        for _ in result.to_logs():
+            pass
+        return result
@@ -0,0 +1,175 @@
+from functools import lru_cache
+import hashlib
+from importlib import metadata
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from aasist.src.gui.handler import LogLevel
+
+# 저장 형식이 바뀌면 올려서 기존 캐시를 무효화 (검증 규칙 변경은 rules_fingerprint가 반영)
+CACHE_VERSION = 1
+_TESTER_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = Path.home() / ".aasist" / "validation_cache"
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024  # 256MB
+
+_READ_CHUNK = 1024 * 1024
+_STALE_TMP_SECONDS = 60 * 60  # 이보다 오래된 *.tmp는 중단된 기록으로 보고 삭제
+
+
+def engine_version() -> str:
+    try:
+        return metadata.version("aas_test_engines")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def rules_fingerprint() -> Optional[str]:
+    """
+    검증 코드(module/tester 아래 소스)의 해시: 규칙/로그를 고치면 자동으로 다른 캐시 키
+    소스가 없는 실행 파일(PyInstaller)은 실행 파일 크기/수정 시각, 둘 다 없으면 None (캐시 사용 안 함)
+    """
+    digest = hashlib.sha256()
+    sources = sorted(_TESTER_DIR.rglob("*.py"))
+    if sources:
+        for source in sources:
+            digest.update(source.relative_to(_TESTER_DIR).as_posix().encode())
+            digest.update(source.read_bytes())
+        return digest.hexdigest()
+    if getattr(sys, "frozen", False):
+        stat = os.stat(sys.executable)
+        digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+        return digest.hexdigest()
+    return None
+
+
+class ValidationResultCache:
+    """
+    파일 내용 + 선택 옵션 + aas_test_engines 버전 + 검증 코드 해시를 키로 검증 로그/결과를 디스크에 저장
+    LRU: 조회 시 mtime을 갱신하고, 크기 제한을 넘으면 오래된 항목부터 삭제
+    """
+
+    def __init__(self, directory: Path = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.directory = Path(directory or DEFAULT_CACHE_DIR)
+        self.max_size = max_size
+
+    def key(
+        self,
+        file: str,
+        idta_options: Dict[str, bool],
+        kosmo_options: Dict[str, bool],
+        streaming: bool = False,
+    ) -> str:
+        digest = hashlib.sha256()
+        with open(file, "rb") as f:
+            while chunk := f.read(_READ_CHUNK):
+                digest.update(chunk)
+        digest.update(
+            json.dumps(
+                {
+                    "cache": CACHE_VERSION,
+                    "engine": engine_version(),
+                    "rules": rules_fingerprint(),
+                    "idta": idta_options,
+                    "kosmo": kosmo_options,
+                    # 스트리밍 모드는 로그 순서가 달라 따로 캐시 (기존 키는 그대로)
+                    **({"streaming": True} if streaming else {}),
+                },
+                sort_keys=True,
+            ).encode()
+        )
+        return digest.hexdigest()
+
+    def get(
+        self, key: str
+    ) -> Optional[Tuple[List[Tuple[str, LogLevel]], Dict[str, bool]]]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            logs = [(message, LogLevel[level]) for message, level in entry["logs"]]
+            results: Dict[str, bool] = entry["results"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return logs, results
+
+    def put(
+        self,
+        key: str,
+        logs: List[Tuple[str, LogLevel]],
+        results: Dict[str, bool],
+    ):
+        entry = {
+            "logs": [(message, level.name) for message, level in logs],
+            "results": results,
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # 다른 프로세스가 읽는 중에도 깨진 파일이 보이지 않도록 교체 방식으로 기록
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp, self._path(key))
+        except OSError:
+            _unlink(Path(tmp))
+            return
+        except BaseException:
+            _unlink(Path(tmp))
+            raise
+        self._evict()
+
+    def clear(self):
+        for path in self.directory.glob("*.json"):
+            _unlink(path)
+        for path in self.directory.glob("*.tmp"):
+            _unlink(path)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _evict(self):
+        # 기록 도중 종료된 프로세스가 남긴 임시 파일 (기록 중인 파일은 건드리지 않도록 오래된 것만)
+        stale = time.time() - _STALE_TMP_SECONDS
+        for path in self.directory.glob("*.tmp"):
+            try:
+                if path.stat().st_mtime < stale:
+                    path.unlink()
+            except OSError:
+                continue
+
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_size:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+
+
+def _unlink(path: Path):
+    try:
+        path.unlink()
+    except OSError:
+        pass
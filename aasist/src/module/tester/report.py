@@ -0,0 +1,137 @@
+from dataclasses import asdict, dataclass, field
+import json
+from typing import Dict, List, Tuple
+from xml.etree import ElementTree
+
+from aasist.src.gui.handler import LogLevel
+from aasist.src.module.tester.constants import CHECKLIST
+from aasist.src.module.tester.file.file_verificator import RESULT_LOG_HEADER
+from aasist.src.module.tester.file.result_cache import engine_version
+
+
+@dataclass
+class RuleReport:
+    rule: str
+    title: str
+    passed: bool
+    violations: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FileReport:
+    file: str
+    seconds: float
+    rules: List[RuleReport] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)  # 규칙 밖에서 발생한 오류
+
+    @property
+    def passed(self) -> bool:
+        return bool(self.rules) and not self.errors and all(r.passed for r in self.rules)
+
+
+def build_file_report(
+    file: str,
+    results: Dict[str, bool],
+    logs: List[Tuple[str, LogLevel]],
+    seconds: float,
+) -> FileReport:
+    """
+    로그 스트림에서 규칙 제목(CHECKLIST) 다음에 나온 ERROR 로그를 해당 규칙의 위반으로 분류
+    """
+    titles = {CHECKLIST[rule]: rule for rule in results if rule in CHECKLIST}
+    violations: Dict[str, List[str]] = {}
+    errors: List[str] = []
+
+    current = None
+    for message, level in logs:
+        if message == RESULT_LOG_HEADER:
+            break
+        if level == LogLevel.INFO and message in titles:
+            current = titles[message]
+            continue
+        if level != LogLevel.ERROR:
+            continue
+        if current is None:
+            errors.append(message)
+        else:
+            violations.setdefault(current, []).append(message)
+
+    return FileReport(
+        file=file,
+        seconds=seconds,
+        rules=[
+            RuleReport(
+                rule=rule,
+                title=CHECKLIST.get(rule, rule),
+                passed=ok,
+                violations=violations.get(rule, []),
+            )
+            for rule, ok in results.items()
+        ],
+        errors=errors,
+    )
+
+
+def write_json_report(reports: List[FileReport], path: str, seconds: float):
+    passed = sum(1 for report in reports if report.passed)
+    document = {
+        "engine": {"aas_test_engines": engine_version()},
+        "summary": {
+            "files": len(reports),
+            "passed": passed,
+            "failed": len(reports) - passed,
+            "seconds": round(seconds, 3),
+        },
+        "files": [
+            {**asdict(report), "seconds": round(report.seconds, 3), "passed": report.passed}
+            for report in reports
+        ],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, ensure_ascii=False, indent=2)
+
+
+def write_junit_report(reports: List[FileReport], path: str, seconds: float):
+    """
+    파일 -> testsuite, 규칙 -> testcase, 위반 -> failure
+    """
+    suites = ElementTree.Element(
+        "testsuites",
+        name="aasist",
+        tests=str(sum(len(report.rules) for report in reports)),
+        failures=str(sum(not rule.passed for r in reports for rule in r.rules)),
+        errors=str(sum(1 for report in reports if report.errors)),
+        time=f"{seconds:.3f}",
+    )
+    for report in reports:
+        suite = ElementTree.SubElement(
+            suites,
+            "testsuite",
+            name=report.file,
+            tests=str(len(report.rules)),
+            failures=str(sum(not rule.passed for rule in report.rules)),
+            errors=str(1 if report.errors else 0),
+            time=f"{report.seconds:.3f}",
+        )
+        if report.errors:
+            case = ElementTree.SubElement(
+                suite, "testcase", classname=report.file, name="file"
+            )
+            error = ElementTree.SubElement(
+                case, "error", message=f"{len(report.errors)} error(s)"
+            )
+            error.text = "\n".join(report.errors)
+        for rule in report.rules:
+            case = ElementTree.SubElement(
+                suite, "testcase", classname=report.file, name=rule.rule
+            )
+            if not rule.passed:
+                failure = ElementTree.SubElement(
+                    case, "failure", message=f"{len(rule.violations)} violation(s)"
+                )
+                failure.text = "\n".join(rule.violations)
+            ElementTree.SubElement(case, "system-out").text = rule.title
+
+    tree = ElementTree.ElementTree(suites)
+    ElementTree.indent(tree)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,303 @@
+"""
+XmlTableExtractor._apply_hierarchy 벤치마크 / 이전 구현(pandas 행 단위 역탐색)과의 결과 비교
+
+    python benchmarks/hierarchy_bench.py                  # 100k 요소 서브모델 (1000 SMC x 100)
+    python benchmarks/hierarchy_bench.py --reference      # 이전 구현 시간도 측정 (수십 초)
+    python benchmarks/hierarchy_bench.py --check 600      # 임의 표 600개 x 4 조합 결과 비교
+"""
+
+import argparse
+from pathlib import Path
+import random
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+
+from aasist.src.module.guidance.schema_types import ParentElement
+from aasist.src.module.guidance.xml.xml_table_extractor import (
+    _ROW_COLUMNS,
+    XmlTableExtractor,
+)
+
+_MODEL_TYPES = [
+    "property",
+    "submodelElementCollection",
+    "multiLanguageProperty",
+    "entity",
+    "file",
+    "SMC",
+    "Prop",
+    "submodelElementList",
+    "operation",
+    "range",
+]
+_SELECTED_COLUMNS = ["model_type", "id_short", "value"]
+
+
+class ReferenceHierarchy:
+    """
+    이전 _apply_hierarchy 구현 (행마다 이전 행을 거꾸로 탐색, O(n^2))
+    """
+
+    def __init__(self, hide_depth_attributes: bool, columns: Optional[List[str]]):
+        self.hide_depth_attributes = hide_depth_attributes
+        self.columns = columns
+
+    def _apply_hierarchy(self, df: pd.DataFrame) -> pd.DataFrame:
+        df["depth"] = pd.Categorical(
+            df["depth"], categories=sorted(df["depth"].unique()), ordered=True
+        ).codes
+
+        df_ = df.apply(lambda row: SimpleNamespace(**row), axis=1)
+
+        depth = df["depth"].unique()
+
+        max_depth = len(depth)
+        min_depth = min(dp for dp in depth)
+
+        for i in range(1, max_depth):
+            df[f"SMC{i:02}"] = None
+
+        prev_ancestors: dict[int, Any] = None
+
+        for i, r in enumerate(df_):
+            if r is None:
+                continue
+
+            r.index = i
+
+            if self.hide_depth_attributes:
+                if not self._have_children(r.index, df_):
+
+                    all_ancestors = list(self._find_all_ancestors(r.index, df_))
+
+                    if not all_ancestors or (
+                        self._find_parent(r.index, df_) < 0 and r.depth == min_depth
+                    ):
+                        df.at[r.index, f"SMC{r.depth+1:02}"] = "-"
+                        continue
+
+                    seen = set()
+                    current_ancestors = {
+                        d: a.id_short
+                        for d, a in all_ancestors
+                        if (d not in seen and not seen.add(d))
+                    }
+
+                    if not prev_ancestors:
+                        prev_ancestors = current_ancestors.copy()
+
+                    if (
+                        ParentElement.contains(df_[r.index - 1].model_type)
+                        or r.index == 0
+                        or prev_ancestors != current_ancestors
+                    ):
+                        for depth, ancestor in current_ancestors.items():
+                            df.at[r.index, f"SMC{depth+1:02}"] = ancestor
+
+                    prev_ancestors = current_ancestors.copy()
+
+                elif ParentElement.contains(r.model_type):
+                    df.loc[r.index] = None
+                    df.at[r.index, f"SMC{r.depth+1:02}"] = r.id_short
+
+                continue
+
+            if ParentElement.contains(r.model_type):
+                df.at[r.index, f"SMC{r.depth+1:02}"] = r.id_short
+            elif r.depth == min_depth:
+                df.at[r.index, f"SMC{r.depth+1:02}"] = "-"
+            else:
+                parent_idx = self._find_parent(r.index, df_)
+                if parent_idx >= 0:
+                    df.at[r.index, f"SMC{r.depth:02}"] = df_[parent_idx].id_short
+
+        group_columns = [col for col in df.columns if col.startswith("SMC")]
+        other_columns = [col for col in df.columns if col not in group_columns]
+
+        df = df[group_columns + (other_columns if not self.columns else self.columns)]
+        df = df.copy()
+        if self.hide_depth_attributes:
+            df = df[~df["id_short"].isna()]
+        df.drop(["depth", "index"], axis=1, inplace=True, errors="ignore")
+        return df
+
+    def _have_children(self, start: int, df_: pd.DataFrame) -> bool:
+        current_depth = df_[start].depth
+        for i in range(start + 1, len(df_)):
+            if current_depth < df_[i].depth:
+                return True
+            else:
+                return False
+        return False
+
+    def _find_all_ancestors(
+        self, start: int, df_: pd.DataFrame, min_depth: int = 0
+    ) -> Iterable[Tuple[int, SimpleNamespace]]:
+        if start <= 0:
+            return
+        current_depth = df_[start].depth
+        for i in range(start - 1, -1, -1):
+            if current_depth > df_[i].depth and ParentElement.contains(
+                df_[i].model_type
+            ):
+                yield (df_[i].depth, df_[i])
+            if df_[i].depth == min_depth:
+                return
+
+    def _find_parent(self, start: int, df_: pd.DataFrame) -> int:
+        if start <= 0:
+            return -1
+        current_depth = df_[start].depth
+        for i in range(start - 1, -1, -1):
+            if current_depth > df_[i].depth and ParentElement.contains(
+                df_[i].model_type
+            ):
+                return i
+        return -1
+
+
+def _extractor(hide_depth_attributes: bool, columns: Optional[List[str]]):
+    return XmlTableExtractor(
+        file_name="bench",
+        parser=None,
+        columns=columns,
+        hide_depth_attributes=hide_depth_attributes,
+    )
+
+
+def _empty_columns() -> Dict[str, List[Any]]:
+    return {name: [] for name in _ROW_COLUMNS}
+
+
+def _append_row(columns: Dict[str, List[Any]], **values: Any):
+    for name, column in columns.items():
+        column.append(values.get(name))
+
+
+def grouped_columns(rows: int, groups: int) -> Dict[str, List[Any]]:
+    """
+    SMC groups개 아래에 Property가 나란히 있는 서브모델 (총 rows행)
+    """
+    columns = _empty_columns()
+    per_group = rows // groups
+    for g in range(groups):
+        _append_row(
+            columns,
+            index=g * per_group,
+            depth=3,
+            model_type="submodelElementCollection",
+            id_short=f"smc{g}",
+        )
+        for k in range(per_group - 1):
+            _append_row(
+                columns,
+                index=g * per_group + k + 1,
+                depth=5,
+                model_type="property",
+                id_short=f"p{g}_{k}",
+                value="v",
+            )
+    return columns
+
+
+def random_columns(rnd: random.Random, rows: int, tree: bool) -> Dict[str, List[Any]]:
+    """
+    tree: 깊이가 한 단계씩 변하는 정상 구조, 아니면 임의의 깊이 순서
+    """
+    columns = _empty_columns()
+    depth = 0
+    for i in range(rows):
+        if tree:
+            depth = max(0, min(depth + rnd.choice([-2, -1, 0, 0, 1, 1]), 8))
+        else:
+            depth = rnd.randint(0, 6)
+        _append_row(
+            columns,
+            index=i,
+            depth=depth * 2 + 3,
+            model_type=rnd.choice(_MODEL_TYPES),
+            id="sm",
+            id_short=None if rnd.random() < 0.03 else f"e{i}",
+            semantic_id=f"s{i}",
+            description="",
+            value="v",
+            definition="",
+        )
+    return columns
+
+
+def _copy(columns: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    return {name: list(values) for name, values in columns.items()}
+
+
+def _normalized(df: pd.DataFrame) -> pd.DataFrame:
+    # 이전 구현은 빈 값이 None/NaN으로 섞여 있음 (export 시 둘 다 빈 칸)
+    df = df.astype(object)
+    return df.where(df.notna(), None)
+
+
+def check(trials: int, seed: int = 1) -> int:
+    rnd = random.Random(seed)
+    compared = 0
+    for _ in range(trials):
+        columns = random_columns(
+            rnd, rnd.choice([1, 2, 3, 5, 10, 40, 200]), tree=rnd.random() < 0.5
+        )
+        if rnd.random() < 0.2:
+            columns["depth"] = [5] * len(columns["depth"])  # 단일 깊이
+        for hide in (False, True):
+            for selected in (None, _SELECTED_COLUMNS):
+                expected = ReferenceHierarchy(hide, selected)._apply_hierarchy(
+                    pd.DataFrame(_copy(columns))
+                )
+                actual = _extractor(hide, selected)._apply_hierarchy(_copy(columns))
+                pd.testing.assert_frame_equal(
+                    _normalized(pd.DataFrame(actual, columns=list(actual))),
+                    _normalized(expected.reset_index(drop=True)),
+                )
+                compared += 1
+    return compared
+
+
+def bench(rows: int, groups: int, reference: bool):
+    columns = grouped_columns(rows, groups)
+    print(f"rows={len(columns['depth'])} groups={groups}")
+    for hide in (False, True):
+        t = time.perf_counter()
+        _extractor(hide, None)._apply_hierarchy(_copy(columns))
+        line = f"  hide_depth={hide!s:5}  new {time.perf_counter() - t:7.2f}s"
+        if reference:
+            t = time.perf_counter()
+            ReferenceHierarchy(hide, None)._apply_hierarchy(
+                pd.DataFrame(_copy(columns))
+            )
+            line += f"  reference {time.perf_counter() - t:7.2f}s"
+        print(line, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument(
+        "--reference", action="store_true", help="also time the previous implementation"
+    )
+    parser.add_argument(
+        "--check", type=int, metavar="N", help="compare both implementations on N random tables"
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        print(f"identical: {check(args.check)} tables")
+        return
+    bench(args.rows, args.groups, args.reference)
+
+
+if __name__ == "__main__":
+    main()
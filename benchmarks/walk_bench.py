@@ -0,0 +1,113 @@
+"""
+XmlTableParser._iterate_elements(명시적 스택) 벤치마크 / 이전 재귀 구현과 비교
+
+    python benchmarks/walk_bench.py                       # 깊이 50, 200, 900, 5000
+    python benchmarks/walk_bench.py --depths 50 100 --width 500
+
+깊이는 중첩된 SubmodelElementCollection 수 (XML 기준으로는 collection/value 두 단계씩)
+재귀 구현은 XML 깊이가 재귀 한도(기본 1000)에 가까워지면 RecursionError
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import time
+from typing import Callable, Iterable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from lxml import etree
+
+from aasist.src.module.guidance.xml.xml_schema_types import _AAS_KEY
+from aasist.src.module.guidance.xml.xml_table_parser import XmlTableParser
+
+
+def recursive_walk(
+    element: etree._Element, level: int = 0
+) -> Iterable[Tuple[etree._Element, int]]:
+    """
+    이전 _iterate_elements (자식마다 재귀 generator)
+    """
+    if element is None:
+        return
+    for child in element.iterchildren():
+        yield child, level + 1
+        yield from recursive_walk(child, level + 1)
+
+
+def _sub(parent: etree._Element, tag: str, text: str = None) -> etree._Element:
+    element = etree.SubElement(parent, _AAS_KEY + tag)
+    element.text = text
+    return element
+
+
+def _property(parent: etree._Element, id_short: str):
+    prop = _sub(parent, "property")
+    _sub(prop, "idShort", id_short)
+    _sub(prop, "valueType", "xs:string")
+    _sub(prop, "value", "v")
+
+
+def deep_submodels(depth: int, width: int) -> etree._Element:
+    """
+    submodels 아래 width개의 서브모델, 각각 depth단계로 중첩된 SMC (단계마다 Property 3개)
+    lxml 파서의 깊이 제한(256)을 넘으므로 파일을 파싱하지 않고 메모리에서 생성
+    """
+    submodels = etree.Element(_AAS_KEY + "submodels")
+    for w in range(width):
+        submodel = _sub(submodels, "submodel")
+        _sub(submodel, "idShort", f"Deep{w}")
+        _sub(submodel, "id", f"https://example.com/ids/sm/deep/{w}")
+        value = _sub(submodel, "submodelElements")
+        for d in range(depth):
+            collection = _sub(value, "submodelElementCollection")
+            _sub(collection, "idShort", f"C{d}")
+            value = _sub(collection, "value")
+            for k in range(3):
+                _property(value, f"P{d}_{k}")
+    return submodels
+
+
+def _time(
+    walk: Callable[[etree._Element, int], Iterable[Tuple[etree._Element, int]]],
+    root: etree._Element,
+    repeat: int,
+) -> Tuple[float, List[Tuple[etree._Element, int]]]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = list(walk(root, 0))
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--depths", type=int, nargs="+", default=[50, 200, 900, 5000])
+    parser.add_argument("--width", type=int, default=200, help="submodels per depth")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    stack_walk = XmlTableParser(file=None)._iterate_elements
+    for depth in args.depths:
+        # 깊은 경우 요소 수를 비슷하게 맞춤
+        width = max(1, args.width * 50 // max(depth, 50))
+        root = deep_submodels(depth, width)
+        xml_depth = max(level for _, level in stack_walk(root, 0))
+
+        stack_time, stack_result = _time(stack_walk, root, args.repeat)
+        try:
+            recursive_time, recursive_result = _time(recursive_walk, root, args.repeat)
+            same = recursive_result == stack_result
+            recursive = f"recursive {recursive_time:7.3f}s  same={same}"
+        except RecursionError:
+            recursive = "recursive RecursionError"
+        print(
+            f"depth={depth:5} xml_depth={xml_depth:5} width={width:4} "
+            f"nodes={len(stack_result):7}  stack {stack_time:7.3f}s  {recursive}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
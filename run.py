@@ -2,13 +2,13 @@ import subprocess
 import sys
 
 
-def run_module(module_name):
-    subprocess.run([sys.executable, "-m", module_name])
+def run_module(module_name, *args) -> int:
+    return subprocess.run([sys.executable, "-m", module_name, *args]).returncode
 
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: aasist-run <guidance | test | one>")
+        print("Usage: aasist-run <guidance | test | one> [--headless ...]")
         sys.exit(1)
 
     mode = sys.argv[1].lower()
@@ -19,6 +19,20 @@ def main():
         "one": "aasist.src.gui.aasist_one.main",
     }
 
+    headless_modules = {
+        "guidance": "aasist.src.cli.guidance_cli",
+        "test": "aasist.src.cli.test_cli",
+    }
+
+    if "--headless" in sys.argv[2:]:
+        if mode not in headless_modules:
+            print(
+                f"No headless mode for: {mode}. Available: {', '.join(headless_modules.keys())}"
+            )
+            sys.exit(1)
+        args = [arg for arg in sys.argv[2:] if arg != "--headless"]
+        sys.exit(run_module(headless_modules[mode], *args))
+
     if mode in modules:
         run_module(modules[mode])
         sys.exit(1)